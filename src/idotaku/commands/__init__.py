@@ -1,18 +1,18 @@
 """CLI commands for idotaku."""
 
 from .run import run_proxy
-from .report import report
-from .sequence import sequence
-from .lifeline import lifeline
-from .chain import chain
+from .report import report, run_report
+from .sequence import sequence, run_sequence
+from .lifeline import lifeline, run_lifeline
+from .chain import chain, run_chain
 from .version import version
 from .interactive_cmd import interactive
-from .csv_cmd import csv_export
-from .sarif_cmd import sarif_export
-from .score_cmd import score
+from .csv_cmd import csv_export, run_csv_export
+from .sarif_cmd import sarif_export, run_sarif_export
+from .score_cmd import score, run_score
 from .har_cmd import har_import
 from .diff_cmd import diff
-from .auth_cmd import auth
+from .auth_cmd import auth, run_auth
 from .config_cmd import config
 from .verify_cmd import verify
 
@@ -32,4 +32,12 @@ __all__ = [
     "auth",
     "config",
     "verify",
+    "run_report",
+    "run_sequence",
+    "run_lifeline",
+    "run_chain",
+    "run_csv_export",
+    "run_sarif_export",
+    "run_score",
+    "run_auth",
 ]
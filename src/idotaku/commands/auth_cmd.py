@@ -6,7 +6,7 @@ import click
 from rich.console import Console
 from rich.table import Table
 
-from ..report import load_report
+from ..report import ReportData, load_report
 from ..report.auth_analysis import detect_cross_user_access
 
 console = Console()
@@ -20,8 +20,11 @@ def auth(report_file: str) -> None:
     Detects cases where different auth tokens (users) access the same
     resource with the same ID - a strong indicator of IDOR vulnerability.
     """
-    data = load_report(report_file)
+    run_auth(load_report(report_file))
 
+
+def run_auth(data: ReportData) -> None:
+    """Print cross-user access patterns found in a loaded report."""
     if not data.flows:
         console.print("[yellow]No flows found in report.[/yellow]")
         return
@@ -10,8 +10,8 @@ from rich.console import Console
 from rich.tree import Tree
 
 from ..config import IdotakuConfig
-from ..report import load_report
-from ..report.analysis import build_param_flow_mappings, build_flow_graph
+from ..report import ReportData, load_report
+from ..report.analysis import build_param_flow_mappings, build_flow_graph, find_chain_roots
 from ..export import export_chain_html
 from ..utils import normalize_api_path, extract_domain
 
@@ -87,8 +87,17 @@ def chain(report_file: str, top: int, min_depth: int, html_output: str | None, d
     \b
       idotaku chain report.json --domains "api.example.com,*.internal.com"
     """
-    data = load_report(report_file)
+    run_chain(load_report(report_file), top, min_depth, html_output, domains)
 
+
+def run_chain(
+    data: ReportData,
+    top: int = 10,
+    min_depth: int = 2,
+    html_output: str | None = None,
+    domains: str | None = None,
+) -> None:
+    """Print ranked parameter chains for a loaded report."""
     if not data.flows:
         console.print("[yellow]No flows found in report.[/yellow]")
         return
@@ -125,30 +134,6 @@ def chain(report_file: str, top: int, min_depth: int, html_output: str | None, d
         path = path.replace("[", "\\[")
         return f"[bold magenta]{method}[/bold magenta] [white]{path}[/white]"
 
-    def calc_tree_depth(flow_idx: int, visited: set[int]) -> int:
-        """Calculate max depth from this flow."""
-        if flow_idx in visited:
-            return 0
-        visited.add(flow_idx)
-        edges = flow_graph.get(flow_idx, [])
-        if not edges:
-            return 1
-        max_child_depth = 0
-        for next_idx, _ in edges:
-            child_depth = calc_tree_depth(next_idx, visited.copy())
-            max_child_depth = max(max_child_depth, child_depth)
-        return 1 + max_child_depth
-
-    def count_tree_nodes(flow_idx: int, visited: set[int]) -> int:
-        """Count total nodes in tree."""
-        if flow_idx in visited:
-            return 0
-        visited.add(flow_idx)
-        count = 1
-        for next_idx, _ in flow_graph.get(flow_idx, []):
-            count += count_tree_nodes(next_idx, visited.copy())
-        return count
-
     def get_api_key(flow_idx: int) -> str:
         """Get API key (method + normalized path) for cycle detection."""
         flow = sorted_flows[flow_idx]
@@ -256,16 +241,13 @@ def chain(report_file: str, top: int, min_depth: int, html_output: str | None, d
     # Find root candidates (flows that produce params used by others)
     # and rank by tree size/depth
     root_candidates = []
-    for flow_idx in flow_produces.keys():
-        if flow_graph.get(flow_idx):  # Has outgoing edges
-            depth = calc_tree_depth(flow_idx, set())
-            nodes = count_tree_nodes(flow_idx, set())
-            if depth >= min_depth:
-                # Score: prioritize depth, then breadth
-                score = depth * 100 + nodes
-                root_candidates.append((score, depth, nodes, flow_idx))
+    for flow_idx, depth, nodes in find_chain_roots(flow_graph, flow_produces, sorted_flows, min_depth):
+        # Score: prioritize depth, then breadth
+        score = depth * 100 + nodes
+        root_candidates.append((score, depth, nodes, flow_idx))
 
-    root_candidates.sort(key=lambda x: x[0], reverse=True)
+    # Highest score first; ties keep flow order
+    root_candidates.sort(key=lambda x: (-x[0], x[3]))
 
     # Deduplicate: remove roots that are subtrees of higher-ranked roots
     covered_flows = set()
@@ -275,14 +257,15 @@ def chain(report_file: str, top: int, min_depth: int, html_output: str | None, d
         if flow_idx not in covered_flows:
             selected_roots.append((score, depth, nodes, flow_idx))
             # Mark all flows in this tree as covered
-            def mark_covered(idx: int, visited: set[int]) -> None:
-                if idx in visited:
-                    return
-                visited.add(idx)
+            pending = [flow_idx]
+            visited = {flow_idx}
+            while pending:
+                idx = pending.pop()
                 covered_flows.add(idx)
                 for next_idx, _ in flow_graph.get(idx, []):
-                    mark_covered(next_idx, visited)
-            mark_covered(flow_idx, set())
+                    if next_idx not in visited:
+                        visited.add(next_idx)
+                        pending.append(next_idx)
 
             if len(selected_roots) >= top:
                 break
@@ -5,7 +5,7 @@ from typing import Literal, cast
 import click
 from rich.console import Console
 
-from ..report import load_report
+from ..report import ReportData, load_report
 from ..export.csv_exporter import export_csv
 
 console = Console()
@@ -21,8 +21,11 @@ def csv_export(report_file: str, output: str | None, mode: str) -> None:
 
     Exports IDOR candidates or flow records as CSV for spreadsheet analysis.
     """
-    data = load_report(report_file)
+    run_csv_export(load_report(report_file), output, mode)
 
+
+def run_csv_export(data: ReportData, output: str | None = None, mode: str = "idor") -> None:
+    """Export a loaded report to CSV."""
     if output is None:
         output = f"idotaku_{mode}.csv"
 
@@ -13,7 +13,11 @@ console = Console()
 @click.argument("har_file", type=click.Path(exists=True))
 @click.option("--output", "-o", default="id_tracker_report.json", help="Output report file")
 @click.option("--config", "-c", default=None, help="Config file path (idotaku.yaml)")
-def har_import(har_file: str, output: str, config: str | None) -> None:
+@click.option(
+    "--workers", "-j", default=1, type=click.IntRange(min=1),
+    help="Worker processes for parsing entries (helps on large HAR files)",
+)
+def har_import(har_file: str, output: str, config: str | None, workers: int) -> None:
     """Import a HAR file and generate an idotaku report.
 
     Analyzes HTTP traffic captured by browsers (DevTools) or tools like
@@ -21,7 +25,7 @@ def har_import(har_file: str, output: str, config: str | None) -> None:
     """
     cfg = load_config(config)
     try:
-        report = import_har_to_file(har_file, output, cfg)
+        report = import_har_to_file(har_file, output, cfg, workers)
     except (ValueError, OSError) as e:
         console.print(f"[red]Error:[/red] {e}")
         raise SystemExit(1) from e
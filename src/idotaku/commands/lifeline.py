@@ -6,7 +6,7 @@ from urllib.parse import urlparse
 import click
 from rich.console import Console
 
-from ..report import load_report
+from ..report import ReportData, load_report
 
 console = Console()
 
@@ -23,8 +23,11 @@ def lifeline(report_file: str, min_uses: int, sort: str) -> None:
     Long-lived params = important business entities (user_id, session).
     Short-lived params = temporary/transient (csrf_token, temp_id).
     """
-    data = load_report(report_file)
+    run_lifeline(load_report(report_file), min_uses, sort)
 
+
+def run_lifeline(data: ReportData, min_uses: int = 1, sort: str = "lifespan") -> None:
+    """Print parameter lifelines for a loaded report."""
     if not data.flows:
         console.print("[yellow]No flows found in report.[/yellow]")
         return
@@ -4,7 +4,7 @@ import click
 from rich.console import Console
 from rich.table import Table
 
-from ..report import load_report
+from ..report import ReportData, load_report
 
 console = Console()
 
@@ -13,8 +13,11 @@ console = Console()
 @click.argument("report_file", default="id_tracker_report.json", type=click.Path(exists=True))
 def report(report_file: str) -> None:
     """View ID tracking report."""
-    data = load_report(report_file)
+    run_report(load_report(report_file))
 
+
+def run_report(data: ReportData) -> None:
+    """Print the summary and IDOR table for a loaded report."""
     summary = data.summary
     console.print()
     console.print("[bold blue]ID Tracker Report[/bold blue]")
@@ -3,7 +3,7 @@
 import click
 from rich.console import Console
 
-from ..report import load_report
+from ..report import ReportData, load_report
 from ..export.sarif_exporter import export_sarif
 
 console = Console()
@@ -12,15 +12,20 @@ console = Console()
 @click.command("sarif")
 @click.argument("report_file", default="id_tracker_report.json", type=click.Path(exists=True))
 @click.option("--output", "-o", default="idotaku.sarif.json", help="Output SARIF file path")
-def sarif_export(report_file: str, output: str) -> None:
+@click.option("--pretty", is_flag=True, help="Indent the SARIF JSON for readability")
+def sarif_export(report_file: str, output: str, pretty: bool) -> None:
     """Export IDOR findings to SARIF format.
 
     Generates a SARIF 2.1.0 file for GitHub Code Scanning and other
     SARIF-compatible security tools.
     """
-    data = load_report(report_file)
+    run_sarif_export(load_report(report_file), output, pretty)
+
+
+def run_sarif_export(data: ReportData, output: str = "idotaku.sarif.json", pretty: bool = False) -> None:
+    """Export a loaded report's IDOR findings to SARIF."""
     try:
-        export_sarif(output, data)
+        export_sarif(output, data, pretty=pretty)
     except OSError as e:
         console.print(f"[red]Error writing SARIF to {output}:[/red] {e}")
         raise SystemExit(1) from e
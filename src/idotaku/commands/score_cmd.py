@@ -4,7 +4,7 @@ import click
 from rich.console import Console
 from rich.table import Table
 
-from ..report import load_report
+from ..report import ReportData, load_report
 from ..report.scoring import score_all_findings
 
 console = Console()
@@ -28,8 +28,11 @@ def score(report_file: str, min_score: int, level: str | None) -> None:
     Assigns a risk score (0-100) and level (critical/high/medium/low)
     based on HTTP method, parameter location, ID type, and usage patterns.
     """
-    data = load_report(report_file)
+    run_score(load_report(report_file), min_score, level)
 
+
+def run_score(data: ReportData, min_score: int = 0, level: str | None = None) -> None:
+    """Print risk-scored IDOR candidates for a loaded report."""
     if not data.potential_idor:
         console.print("[green]No IDOR candidates to score.[/green]")
         return
@@ -7,7 +7,7 @@ import click
 from rich.console import Console
 from rich.panel import Panel
 
-from ..report import load_report
+from ..report import ReportData, load_report
 from ..export import export_sequence_html
 
 console = Console()
@@ -23,8 +23,11 @@ def sequence(report_file: str, limit: int, html_output: str | None) -> None:
     Visualizes the time-ordered sequence of API calls and shows which
     parameters are passed between them.
     """
-    data = load_report(report_file)
+    run_sequence(load_report(report_file), limit, html_output)
 
+
+def run_sequence(data: ReportData, limit: int = 30, html_output: str | None = None) -> None:
+    """Print the API call timeline for a loaded report."""
     if not data.flows:
         console.print("[yellow]No flows found in report.[/yellow]")
         return
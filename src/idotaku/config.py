@@ -10,6 +10,21 @@ from pathlib import Path
 # ruamel.yaml is already a dependency of mitmproxy
 from ruamel.yaml import YAML, YAMLError
 
+# Leading global inline flags, e.g. "(?i)" in "(?i)^test$"
+_INLINE_FLAGS_RE = re.compile(r"^\(\?([aiLmsux]+)\)")
+
+
+def _scope_inline_flags(pattern: str) -> str:
+    """Turn a leading ``(?flags)`` into a scoped ``(?flags:...)`` group.
+
+    Global inline flags are only valid at the start of a regex, so they
+    have to be scoped before the pattern is joined with others.
+    """
+    m = _INLINE_FLAGS_RE.match(pattern)
+    if m is None:
+        return pattern
+    return f"(?{m.group(1)}:{pattern[m.end():]})"
+
 
 @dataclass
 class IdotakuConfig:
@@ -97,6 +112,20 @@ class IdotakuConfig:
         """Return compiled exclude patterns."""
         return [re.compile(p) for p in self.exclude_patterns]
 
+    def get_compiled_exclude_union(self) -> re.Pattern[str]:
+        """Return all exclude patterns compiled into a single alternation.
+
+        ``union.match(value)`` succeeds exactly when one of the exclude
+        patterns matches ``value``. A leading inline flag group such as
+        ``(?i)`` is scoped to its own pattern. With no exclude patterns the
+        result never matches.
+        """
+        if not self.exclude_patterns:
+            return re.compile(r"(?!)")
+        return re.compile("|".join(
+            f"(?:{_scope_inline_flags(p)})" for p in self.exclude_patterns
+        ))
+
     def get_all_ignore_headers(self) -> set[str]:
         """Return all headers to ignore."""
         return self.ignore_headers | set(h.lower() for h in self.extra_ignore_headers)
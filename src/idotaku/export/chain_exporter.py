@@ -8,6 +8,7 @@ from typing import Any, Union
 from urllib.parse import urlparse
 
 from ..utils.url import normalize_api_path, extract_domain
+from .output import open_output
 from .html_styles import CHAIN_STYLES
 from .html_scripts import CHAIN_SCRIPTS
 
@@ -154,6 +155,105 @@ def _inject_deferred_children(
         _inject_deferred_children(child, deferred_children)
 
 
+def _pack_trees(trees_data: list[dict[str, Any]]) -> dict[str, Any]:
+    """Reshape nested chain trees into columnar arrays for embedding.
+
+    Nested node dicts repeat every key per node, which dominates the payload of
+    large reports. Nodes are laid out breadth-first so the children of each node
+    occupy the contiguous slice ``[cs[n], cs[n] + cc[n])``, and all strings are
+    stored once in a shared table referenced by position (-1 for None).
+    ``inflateTrees`` in the chain script rebuilds the nested objects.
+
+    Args:
+        trees_data: Root trees as built by _build_tree_json (with rank/depth/nodes)
+
+    Returns:
+        Dict of parallel column arrays (see CHAIN_SCRIPTS for the key legend)
+    """
+    strings: list[str] = []
+    string_index: dict[str, int] = {}
+
+    def intern(value: Any) -> int:
+        if value is None:
+            return -1
+        text = str(value)
+        idx = string_index.get(text)
+        if idx is None:
+            idx = string_index[text] = len(strings)
+            strings.append(text)
+        return idx
+
+    def pack_ids(ids: list[dict[str, Any]]) -> list[int]:
+        flat: list[int] = []
+        for id_info in ids:
+            flat.extend((
+                intern(id_info.get("value", "")),
+                intern(id_info.get("type", "")),
+                intern(id_info.get("location", "")),
+                intern(id_info.get("field")),
+            ))
+        return flat
+
+    order: list[dict[str, Any]] = list(trees_data)
+    flags: list[int] = []
+    flow_idxs: list[int] = []
+    indexes: list[int] = []
+    methods: list[int] = []
+    paths: list[int] = []
+    urls: list[int] = []
+    domains: list[int] = []
+    child_start: list[int] = []
+    child_count: list[int] = []
+    via: list[list[int]] = []
+    req_ids: list[list[int]] = []
+    res_ids: list[list[int]] = []
+
+    pos = 0
+    while pos < len(order):
+        node = order[pos]
+        pos += 1
+        is_ref = node.get("type") == "cycle_ref"
+        flags.append((1 if is_ref else 0) | (2 if node.get("from_cycle") else 0))
+        flow_idxs.append(node.get("flow_idx", -1))
+        via.append([intern(p) for p in node.get("via_params") or []])
+        if is_ref:
+            target = node.get("target_index")
+            indexes.append(target if isinstance(target, int) else -1)
+            children: list[dict[str, Any]] = []
+        else:
+            indexes.append(node.get("index", -1))
+            children = node.get("children", [])
+        methods.append(-1 if is_ref else intern(node.get("method")))
+        paths.append(-1 if is_ref else intern(node.get("path")))
+        urls.append(-1 if is_ref else intern(node.get("url")))
+        domains.append(-1 if is_ref else intern(node.get("domain")))
+        req_ids.append([] if is_ref else pack_ids(node.get("request_ids", [])))
+        res_ids.append([] if is_ref else pack_ids(node.get("response_ids", [])))
+        child_start.append(len(order))
+        child_count.append(len(children))
+        order.extend(children)
+
+    return {
+        "s": strings,
+        "fl": flags,
+        "fi": flow_idxs,
+        "ix": indexes,
+        "m": methods,
+        "p": paths,
+        "u": urls,
+        "d": domains,
+        "cs": child_start,
+        "cc": child_count,
+        "v": via,
+        "q": req_ids,
+        "r": res_ids,
+        "rt": [
+            [i, tree.get("rank", 0), tree.get("depth", 0), tree.get("nodes", 0)]
+            for i, tree in enumerate(trees_data)
+        ],
+    }
+
+
 def export_chain_html(
     output_path: Union[str, Path],
     sorted_flows: list[dict[str, Any]],
@@ -201,7 +301,9 @@ def export_chain_html(
         trees_data.append(tree)
 
     # Escape for safe embedding in <script> context (prevent </script> injection)
-    trees_json = json.dumps(trees_data).replace("</", r"<\/")
+    trees_json = json.dumps(_pack_trees(trees_data), separators=(",", ":")).replace(
+        "</", r"<\/"
+    )
 
     # Build HTML content
     html_content = f"""<!DOCTYPE html>
@@ -234,5 +336,5 @@ def export_chain_html(
 </html>
 """
 
-    with open(output_path, "w", encoding="utf-8") as f:
+    with open_output(output_path) as f:
         f.write(html_content)
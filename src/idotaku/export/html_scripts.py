@@ -1,9 +1,67 @@
 """JavaScript code for HTML exports."""
 
 # Chain tree export scripts
-# Note: {trees_json} placeholder will be replaced with actual data
+# Note: {trees_json} placeholder is substituted with str.replace() (not str.format),
+# so JS braces in this template need no escaping
 CHAIN_SCRIPTS = """
-const treesData = {trees_json};
+// Columnar tree payload (see chain_exporter._pack_trees):
+//   s: string table, fl: flags (1 = cycle ref, 2 = from cycle), fi: flow_idx,
+//   ix: node index / cycle target, m/p/u/d: method/path/url/domain string refs,
+//   cs/cc: child slice start/count, v: via param refs,
+//   q/r: request/response ids as flat [value, type, location, field] refs,
+//   rt: roots as [node, rank, depth, nodes]
+const treesPacked = {trees_json};
+
+function inflateTrees(packed) {
+    const s = packed.s;
+    const str = function(i) { return i < 0 ? null : s[i]; };
+    const inflateIds = function(flat) {
+        const ids = [];
+        for (let k = 0; k < flat.length; k += 4) {
+            ids.push({ value: str(flat[k]), type: str(flat[k + 1]), location: str(flat[k + 2]), field: str(flat[k + 3]) });
+        }
+        return ids;
+    };
+    const count = packed.fl.length;
+    const nodes = new Array(count);
+    // Children always follow their parent, so build back to front
+    for (let n = count - 1; n >= 0; n--) {
+        const flags = packed.fl[n];
+        const via = packed.v[n].map(str);
+        if (flags & 1) {
+            nodes[n] = {
+                type: 'cycle_ref',
+                flow_idx: packed.fi[n],
+                target_index: packed.ix[n] < 0 ? '?' : packed.ix[n],
+                via_params: via,
+            };
+            continue;
+        }
+        const children = nodes.slice(packed.cs[n], packed.cs[n] + packed.cc[n]);
+        nodes[n] = {
+            flow_idx: packed.fi[n],
+            index: packed.ix[n],
+            via_params: via,
+            from_cycle: (flags & 2) !== 0,
+            method: str(packed.m[n]),
+            path: str(packed.p[n]),
+            url: str(packed.u[n]),
+            domain: str(packed.d[n]),
+            request_ids: inflateIds(packed.q[n]),
+            response_ids: inflateIds(packed.r[n]),
+            children: children,
+        };
+    }
+    return packed.rt.map(function(root) {
+        const tree = nodes[root[0]];
+        tree.rank = root[1];
+        tree.depth = root[2];
+        tree.nodes = root[3];
+        return tree;
+    });
+}
+
+const treesData = inflateTrees(treesPacked);
 
 // Configuration
 const INDENT_PX = 20;
@@ -11,8 +69,16 @@ const MAX_INDENT_PX = 200;
 const AUTO_COLLAPSE_DEPTH = 3;
 const PARAM_COLLAPSE_THRESHOLD = 5;
 
+// Single-pass escaping; strings with nothing to escape are returned as-is
+const ESC_MAP = {'&': '&amp;', '"': '&quot;', '<': '&lt;', '>': '&gt;', "'": '&#39;'};
+const ESC_TEST = /[&"<>']/;
+const ESC_RE = /[&"<>']/g;
+function escapeHtmlChar(ch) {
+    return ESC_MAP[ch];
+}
 function escapeHtml(s) {
-    return String(s).replace(/&/g,'&amp;').replace(/"/g,'&quot;').replace(/</g,'&lt;').replace(/>/g,'&gt;').replace(/'/g,'&#39;');
+    s = String(s);
+    return ESC_TEST.test(s) ? s.replace(ESC_RE, escapeHtmlChar) : s;
 }
 
 function truncatePath(path, max) {
@@ -20,7 +86,7 @@ function truncatePath(path, max) {
 }
 
 function truncateValue(val, max) {
-    val = String(val);
+    if (typeof val !== 'string') val = String(val);
     return val.length > max ? val.substring(0, max - 2) + '..' : val;
 }
 
@@ -54,7 +120,7 @@ function renderCycleRef(node, depth) {
     const indent = Math.min(depth * INDENT_PX, MAX_INDENT_PX);
     let html = '<div class="node-cycle-ref cycle-ref-' + node.flow_idx + '"'
         + ' style="margin-left:' + indent + 'px"'
-        + ' onclick="scrollToNode(' + node.target_index + ')">';
+        + ' data-action="scroll" data-target="' + node.target_index + '">';
     html += '&#8617; <span class="cycle-target">[#' + node.target_index + ']</span>';
     if (node.via_params && node.via_params.length > 0) {
         html += ' <span class="cycle-params">via ' + escapeHtml(formatParams(node.via_params, 20)) + '</span>';
@@ -66,9 +132,9 @@ function renderCycleRef(node, depth) {
 
 // Render inline param body (Consumes / Produces)
 function renderCardBody(node) {
+    // Callers only invoke this when the node has request or response ids
     const reqIds = node.request_ids || [];
     const resIds = node.response_ids || [];
-    if (reqIds.length === 0 && resIds.length === 0) return '';
 
     // Determine which response values flow to children
     const childViaParams = new Set();
@@ -93,7 +159,7 @@ function renderCardBody(node) {
                 + escapeHtml(truncateValue(label, 24)) + '</span>';
         }
         if (manyParams) {
-            html += '<button class="param-expand-btn" onclick="toggleParamExpand(event)">+'
+            html += '<button class="param-expand-btn" data-action="expand">+'
                 + (reqIds.length - PARAM_COLLAPSE_THRESHOLD) + ' more</button>';
         }
         html += '</div>';
@@ -112,7 +178,7 @@ function renderCardBody(node) {
                 + escapeHtml(truncateValue(label, 24)) + '</span>';
         }
         if (manyParams) {
-            html += '<button class="param-expand-btn" onclick="toggleParamExpand(event)">+'
+            html += '<button class="param-expand-btn" data-action="expand">+'
                 + (resIds.length - PARAM_COLLAPSE_THRESHOLD) + ' more</button>';
         }
         html += '</div>';
@@ -156,7 +222,7 @@ function renderNodeCard(node, depth, isRoot) {
     html += '<div class="node-card-header">';
     if (hasChildren) {
         const symbol = startCollapsed ? '+' : '\\u2212';
-        html += '<span class="toggle-btn" onclick="toggleChildren(event, \\'' + nodeId + '\\')">' + symbol + '</span>';
+        html += '<span class="toggle-btn" data-action="toggle" data-target="' + nodeId + '">' + symbol + '</span>';
     } else {
         html += '<span style="width:18px;display:inline-block"></span>';
     }
@@ -165,17 +231,17 @@ function renderNodeCard(node, depth, isRoot) {
     }
     html += '<span class="node-index">[#' + node.index + ']</span>';
     html += '<span class="method ' + node.method + '">' + node.method + '</span>';
-    html += '<span class="path"'
-        + ' onmouseenter="showUrlPopover(event, \\'' + escapeHtml(node.url).replace(/'/g, "\\\\'") + '\\')"'
-        + ' onmouseleave="hideUrlPopover()">'
+    html += '<span class="path" data-action="popover">'
         + escapeHtml(truncatePath(node.path, 40)) + '</span>';
     if (node.domain) {
         html += '<span class="domain">' + escapeHtml(node.domain) + '</span>';
     }
     html += '</div>';
 
-    // Card body (inline params)
-    html += renderCardBody(node);
+    // Card body (inline params), skipped for the common no-ids case
+    if ((node.request_ids && node.request_ids.length) || (node.response_ids && node.response_ids.length)) {
+        html += renderCardBody(node);
+    }
 
     html += '</div>';
 
@@ -228,11 +294,9 @@ function renderTrees() {
 }
 
 // Toggle children collapse/expand
-function toggleChildren(event, nodeId) {
-    event.stopPropagation();
+function toggleChildren(toggleBtn, nodeId) {
     const childrenEl = document.getElementById('children-' + nodeId);
     if (!childrenEl) return;
-    const toggleBtn = event.target;
 
     if (childrenEl.classList.contains('collapsed')) {
         childrenEl.classList.remove('collapsed');
@@ -247,36 +311,38 @@ function toggleChildren(event, nodeId) {
 }
 
 // Toggle param expand
-function toggleParamExpand(event) {
-    event.stopPropagation();
-    const section = event.target.closest('.param-section');
+function toggleParamExpand(expandBtn) {
+    const section = expandBtn.closest('.param-section');
     if (!section) return;
     if (section.classList.contains('params-collapsed')) {
         section.classList.remove('params-collapsed');
-        event.target.style.display = 'none';
+        expandBtn.style.display = 'none';
     }
 }
 
-// URL popover
-function showUrlPopover(event, fullUrl) {
+// URL popover (full URL is read from the enclosing card's data-full-url)
+let urlPopover = null;
+
+function showUrlPopover(pathEl) {
+    const card = pathEl.closest('.node-card');
+    const fullUrl = card ? card.dataset.fullUrl : '';
     if (!fullUrl || fullUrl === '?') return;
-    let popover = document.getElementById('url-popover');
-    if (!popover) {
-        popover = document.createElement('div');
-        popover.id = 'url-popover';
-        popover.className = 'url-popover';
-        document.body.appendChild(popover);
+    if (!urlPopover) {
+        urlPopover = document.createElement('div');
+        urlPopover.id = 'url-popover';
+        urlPopover.className = 'url-popover';
+        document.body.appendChild(urlPopover);
     }
-    popover.textContent = fullUrl;
-    const rect = event.target.getBoundingClientRect();
+    const popover = urlPopover;
+    if (popover.textContent !== fullUrl) popover.textContent = fullUrl;
+    const rect = pathEl.getBoundingClientRect();
     popover.style.left = rect.left + 'px';
     popover.style.top = (rect.bottom + 6) + 'px';
     popover.classList.add('visible');
 }
 
 function hideUrlPopover() {
-    const popover = document.getElementById('url-popover');
-    if (popover) popover.classList.remove('visible');
+    if (urlPopover) urlPopover.classList.remove('visible');
 }
 
 // Scroll to a node (for cycle ref clicks)
@@ -292,7 +358,7 @@ function scrollToNode(targetIndex) {
             parent.style.maxHeight = parent.scrollHeight + 'px';
             const prevSibling = parent.previousElementSibling;
             if (prevSibling) {
-                const toggleBtn = prevSibling.querySelector('.toggle-btn');
+                const toggleBtn = prevSibling.getElementsByClassName('toggle-btn')[0];
                 if (toggleBtn) toggleBtn.textContent = '\\u2212';
             }
         }
@@ -306,6 +372,37 @@ function scrollToNode(targetIndex) {
     }, 2000);
 }
 
+// Delegated event wiring: one listener per event type dispatches on data-action
+function bindTreeEvents() {
+    const container = document.getElementById('trees');
+
+    container.addEventListener('click', function(event) {
+        const el = event.target.closest('[data-action]');
+        if (!el) return;
+        const action = el.dataset.action;
+        if (action === 'toggle') {
+            event.stopPropagation();
+            toggleChildren(el, el.dataset.target);
+        } else if (action === 'expand') {
+            event.stopPropagation();
+            toggleParamExpand(el);
+        } else if (action === 'scroll') {
+            scrollToNode(el.dataset.target);
+        }
+    });
+
+    container.addEventListener('mouseover', function(event) {
+        const el = event.target.closest('[data-action="popover"]');
+        if (el && !el.contains(event.relatedTarget)) showUrlPopover(el);
+    });
+
+    container.addEventListener('mouseout', function(event) {
+        const el = event.target.closest('[data-action="popover"]');
+        if (el && !el.contains(event.relatedTarget)) hideUrlPopover();
+    });
+}
+
 // Initialize
 renderTrees();
+bindTreeEvents();
 """
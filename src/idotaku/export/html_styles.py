@@ -1,7 +1,25 @@
 """CSS styles for HTML exports."""
 
-# Chain tree export styles
-CHAIN_STYLES = """
+import re
+
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_CSS_WHITESPACE_RE = re.compile(r"\s+")
+_CSS_PUNCT_SPACE_RE = re.compile(r"\s*([{};:,>])\s*")
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments and redundant whitespace from a CSS block.
+
+    Applied once at import time so every export embeds the compact form.
+    """
+    css = _CSS_COMMENT_RE.sub("", css)
+    css = _CSS_WHITESPACE_RE.sub(" ", css)
+    css = _CSS_PUNCT_SPACE_RE.sub(r"\1", css)
+    return css.replace(";}", "}").strip()
+
+
+# Reset and page base shared by every export
+_RESET_STYLES = """
 * { box-sizing: border-box; margin: 0; padding: 0; }
 body {
     font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
@@ -9,7 +27,27 @@ body {
     color: #c9d1d9;
     min-height: 100vh;
 }
+"""
+
+# HTTP method badges shared by every export
+_METHOD_BADGE_STYLES = """
+.method {
+    display: inline-block;
+    padding: 2px 6px;
+    border-radius: 4px;
+    font-size: 0.75em;
+    font-weight: bold;
+    margin-right: 8px;
+}
+.method.GET { background: #238636; color: #fff; }
+.method.POST { background: #a371f7; color: #fff; }
+.method.PUT { background: #f0883e; color: #fff; }
+.method.DELETE { background: #f85149; color: #fff; }
+.method.PATCH { background: #3fb950; color: #fff; }
+"""
 
+# Chain tree export styles
+CHAIN_STYLES = _minify_css(_RESET_STYLES + """
 /* Main Tree Panel */
 .tree-panel {
     padding: 24px;
@@ -75,19 +113,7 @@ body {
 }
 
 /* HTTP Method Badges */
-.method {
-    display: inline-block;
-    padding: 2px 6px;
-    border-radius: 4px;
-    font-size: 0.75em;
-    font-weight: bold;
-    margin-right: 8px;
-}
-.method.GET { background: #238636; color: #fff; }
-.method.POST { background: #a371f7; color: #fff; }
-.method.PUT { background: #f0883e; color: #fff; }
-.method.DELETE { background: #f85149; color: #fff; }
-.method.PATCH { background: #3fb950; color: #fff; }
+""" + _METHOD_BADGE_STYLES + """
 
 /* Card Node */
 .node-card {
@@ -394,29 +420,7 @@ body {
     border-radius: 4px;
     margin: 0 2px;
 }
-"""
+""")
 
 # Common base styles shared by multiple exports
-BASE_STYLES = """
-* { box-sizing: border-box; margin: 0; padding: 0; }
-body {
-    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-    background: #0d1117;
-    color: #c9d1d9;
-    min-height: 100vh;
-}
-
-.method {
-    display: inline-block;
-    padding: 2px 6px;
-    border-radius: 4px;
-    font-size: 0.75em;
-    font-weight: bold;
-    margin-right: 8px;
-}
-.method.GET { background: #238636; color: #fff; }
-.method.POST { background: #a371f7; color: #fff; }
-.method.PUT { background: #f0883e; color: #fff; }
-.method.DELETE { background: #f85149; color: #fff; }
-.method.PATCH { background: #3fb950; color: #fff; }
-"""
+BASE_STYLES = _minify_css(_RESET_STYLES + _METHOD_BADGE_STYLES)
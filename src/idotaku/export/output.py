@@ -0,0 +1,27 @@
+"""Output file helpers for exporters."""
+
+from __future__ import annotations
+
+import gzip
+from pathlib import Path
+from typing import TextIO
+
+GZIP_COMPRESSLEVEL = 6
+
+
+def open_output(output_path: str | Path, buffering: int = -1) -> TextIO:
+    """Open an export file for UTF-8 text writing.
+
+    Paths ending in ``.gz`` are written gzip-compressed, which shrinks HTML and
+    SARIF exports several times over (repeated keys, class names and URLs).
+
+    Args:
+        output_path: Path to output file
+        buffering: Buffer size for uncompressed files (-1 for the default)
+
+    Returns:
+        Writable text file object
+    """
+    if str(output_path).endswith(".gz"):
+        return gzip.open(output_path, "wt", encoding="utf-8", compresslevel=GZIP_COMPRESSLEVEL)
+    return open(output_path, "w", encoding="utf-8", buffering=buffering)
@@ -2,48 +2,63 @@
 
 from __future__ import annotations
 
-import json
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Final, Union
 
 from ..report.models import IDORFindingDict, ReportData
+from ..utils.jsonio import dumps
+from .output import open_output
 
 SARIF_VERSION: Final[str] = "2.1.0"
 SARIF_SCHEMA: Final[str] = "https://raw.githubusercontent.com/oasis-tcs/sarif-spec/main/sarif-2.1/schema/sarif-schema-2.1.0.json"
 
 TOOL_NAME: Final[str] = "idotaku"
 
-RULES: Final[list[dict[str, Any]]] = [
-    {
+# Read-only and shared by every export/result; jsonio.dumps serializes the
+# mapping proxies as plain objects
+RULES: Final[tuple[Mapping[str, Any], ...]] = (
+    MappingProxyType({
         "id": "IDOR001",
         "name": "IDUsedWithoutOrigin",
-        "shortDescription": {
+        "shortDescription": MappingProxyType({
             "text": "ID used in request but never seen in response",
-        },
+        }),
         "helpUri": "https://owasp.org/Top10/A01_2021-Broken_Access_Control/",
-        "defaultConfiguration": {"level": "warning"},
-    },
-]
+        "defaultConfiguration": MappingProxyType({"level": "warning"}),
+    }),
+)
+
+_DEFAULT_LOCATION: Final[tuple[Mapping[str, Any], ...]] = (
+    MappingProxyType({
+        "physicalLocation": MappingProxyType({
+            "artifactLocation": MappingProxyType({"uri": "unknown"}),
+        }),
+    }),
+)
 
 
 def _build_sarif_result(finding: IDORFindingDict) -> dict[str, Any]:
     """Build a single SARIF result from an IDOR finding."""
+    id_value = finding.get("id_value", "")
+    id_type = finding.get("id_type", "")
+    reason = finding.get("reason", "")
     usages = finding.get("usages", [])
 
-    locations = []
-    for usage in usages:
-        locations.append({
+    locations = [
+        {
             "physicalLocation": {
-                "artifactLocation": {
-                    "uri": usage.get("url", ""),
-                },
+                "artifactLocation": {"uri": usage.get("url", "")},
             },
             "properties": {
                 "method": usage.get("method", ""),
                 "location": usage.get("location", ""),
                 "field": usage.get("field", usage.get("field_name", "")),
             },
-        })
+        }
+        for usage in usages
+    ]
 
     return {
         "ruleId": "IDOR001",
@@ -51,16 +66,12 @@ def _build_sarif_result(finding: IDORFindingDict) -> dict[str, Any]:
         "level": "warning",
         "message": {
             "text": f"Potential IDOR: {finding.get('id_type', 'unknown')} ID "
-                    f"'{finding.get('id_value', '?')}' - {finding.get('reason', '')}",
+                    f"'{finding.get('id_value', '?')}' - {reason}",
         },
-        "locations": locations or [{
-            "physicalLocation": {
-                "artifactLocation": {"uri": "unknown"},
-            },
-        }],
+        "locations": locations or _DEFAULT_LOCATION,
         "properties": {
-            "id_value": finding.get("id_value", ""),
-            "id_type": finding.get("id_type", ""),
+            "id_value": id_value,
+            "id_type": id_type,
             "usage_count": len(usages),
         },
     }
@@ -69,8 +80,14 @@ def _build_sarif_result(finding: IDORFindingDict) -> dict[str, Any]:
 def export_sarif(
     output_path: Union[str, Path],
     report_data: ReportData,
+    *,
+    pretty: bool = False,
 ) -> None:
-    """Export IDOR findings to SARIF 2.1.0 format."""
+    """Export IDOR findings to SARIF 2.1.0 format.
+
+    Output is compact by default since SARIF is consumed by tools;
+    pass ``pretty=True`` for indented, human-readable JSON.
+    """
     from .. import __version__
 
     sarif = {
@@ -93,5 +110,5 @@ def export_sarif(
         ],
     }
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(sarif, f, indent=2, ensure_ascii=False)
+    with open_output(output_path) as f:
+        f.write(dumps(sarif, pretty=pretty))
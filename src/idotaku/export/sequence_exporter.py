@@ -2,27 +2,134 @@
 
 from __future__ import annotations
 
-import json
+import html
+import sys
+from collections import Counter
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any, Union
 from urllib.parse import urlparse
 
-from ..utils.url import normalize_api_path, extract_domain
+from ..utils.jsonio import dumps
+from ..utils.url import normalize_path
+from .output import open_output
 from .sequence_styles import SEQUENCE_STYLES
 from .sequence_scripts import SEQUENCE_SCRIPTS
 
 
+# Static script halves around the data placeholder, split once at import
+_SCRIPTS_PREFIX, _SCRIPTS_SUFFIX = SEQUENCE_SCRIPTS.split("{sequence_json}", 1)
+
+# Static document pieces, assembled once at import: the head up to the
+# rendered diagram, the panel/script section up to the embedded JSON, and
+# the tail after it
+_HTML_HEAD = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <meta http-equiv="Content-Security-Policy" content="default-src 'none'; script-src 'unsafe-inline'; style-src 'unsafe-inline';">
+    <title>idotaku - API Sequence Diagram</title>
+    <style>
+{SEQUENCE_STYLES}
+    </style>
+</head>
+<body>
+    <div class="seq-panel">
+        <h1>API Sequence Diagram</h1>
+        <div class="security-warning">
+            <strong>Warning:</strong> This report may contain sensitive data extracted from intercepted HTTP traffic
+            (tokens, session IDs, API keys, cookies). Do not share this file publicly.
+        </div>
+        <div class="subtitle">Click any ID chip to highlight all occurrences across the timeline</div>
+        """
+
+# Static document between the rendered rows and the embedded JSON
+_HTML_PANEL = """
+    </div>
+
+    <div class="id-summary-panel" id="id-summary">
+        <div class="panel-header">
+            <span class="panel-title"></span>
+            <span class="panel-close" onclick="clearHighlight()">&times;</span>
+        </div>
+        <div class="panel-row">
+            <span class="panel-label">Type</span>
+            <span class="panel-value" id="summary-type"></span>
+        </div>
+        <div class="panel-row">
+            <span class="panel-label">Origin</span>
+            <span class="panel-value" id="summary-origin"></span>
+        </div>
+        <div class="panel-row">
+            <span class="panel-label">Used in requests</span>
+            <span class="panel-value" id="summary-usage"></span>
+        </div>
+        <span class="idor-badge" id="summary-idor" style="display:none">Potential IDOR</span>
+    </div>
+
+    <div class="hint" id="hint">Click any ID chip to trace parameter flow</div>
+
+    <script>
+""" + _SCRIPTS_PREFIX
+
+_HTML_TAIL = _SCRIPTS_SUFFIX + """
+    </script>
+</body>
+</html>
+"""
+
+# Lifeline column width in px (matches the --col-width CSS fallback)
+_COL_WIDTH = 160
+_HALF_COL = _COL_WIDTH // 2
+# ID chips shown per arrow before collapsing into "+N"
+_MAX_CHIP_DISPLAY = 4
+_SEQ_CELL_HTML = '<div class="seq-cell"></div>'
+_EMPTY_STATE_HTML = (
+    '<div class="empty-state"><h2>No API flows</h2><p>No flows found in report data.</p></div>'
+)
+
+# Canonical (interned) method strings, so per-flow method values loaded from
+# JSON share one object and compare by identity in dict/Counter lookups
+_METHODS: dict[str, str] = {
+    m: sys.intern(m) for m in ("GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS", "?")
+}
+
+
 def _build_lifeline_key(flow: dict[str, Any]) -> str:
     """Build a lifeline key from a flow (domain + normalized path)."""
-    url = flow.get("url", "")
-    domain = extract_domain(url)
-    normalized = normalize_api_path(url)
-    method = flow.get("method", "?")
+    parsed = urlparse(flow.get("url", ""))
+    return _format_lifeline_key(flow.get("method") or "?", parsed.netloc, normalize_path(parsed.path))
+
+
+def _format_lifeline_key(method: str, domain: str, normalized: str) -> str:
+    """Format a lifeline key from its already-extracted parts."""
     if domain:
         return f"{method} {domain}{normalized}"
     return f"{method} {normalized}"
 
 
+def _truncate(text: str, max_len: int) -> str:
+    """Shorten text to max_len characters, ending in '..' when cut."""
+    return text[: max_len - 2] + ".." if len(text) > max_len else text
+
+
+def _format_arrow_label(method: str, url: str, path: str) -> str:
+    """Build the escaped method badge + path label HTML for a flow arrow."""
+    method_html = html.escape(method)
+    return (
+        f'<span class="method {method_html}">{method_html}</span>'
+        f'<span class="arrow-path" title="{html.escape(url)}">'
+        f"{html.escape(_truncate(path, 30))}</span>"
+    )
+
+
+def _format_time(timestamp: str) -> str:
+    """Extract the escaped HH:MM:SS part of an ISO timestamp ('' if absent)."""
+    _, sep, rest = timestamp.partition("T")
+    return html.escape(rest.partition("T")[0][:8]) if sep else ""
+
+
 def _build_sequence_data(
     sorted_flows: list[dict[str, Any]],
     tracked_ids: dict[str, dict[str, Any]],
@@ -38,7 +145,9 @@ def _build_sequence_data(
         max_lifelines: Maximum number of endpoint lifelines to show
 
     Returns:
-        Dictionary ready for JSON serialization
+        Dictionary ready for JSON serialization. Each flow carries its arrow
+        label and time as pre-escaped HTML (``label_html``, ``time``) so the
+        page does no per-row escaping.
     """
     if not sorted_flows:
         return {
@@ -49,65 +158,42 @@ def _build_sequence_data(
             "id_info": {},
         }
 
-    # Count flows per lifeline key to find top endpoints
-    lifeline_counts: dict[str, int] = {}
+    # Single pass: lifeline key, flow record and ID info per flow.
+    # Each distinct (method, url) is parsed once and its key string shared,
+    # so flow_keys holds U key objects rather than N copies
     flow_keys: list[str] = []
+    flows_data: list[dict[str, Any]] = []
+    id_info: dict[str, dict[str, Any]] = {}
+    url_parts: dict[tuple[str, str], tuple[str, str, str]] = {}
 
-    for flow in sorted_flows:
-        key = _build_lifeline_key(flow)
-        flow_keys.append(key)
-        lifeline_counts[key] = lifeline_counts.get(key, 0) + 1
-
-    # Sort by frequency, take top N
-    sorted_lifelines = sorted(lifeline_counts.items(), key=lambda x: x[1], reverse=True)
-
-    if len(sorted_lifelines) > max_lifelines:
-        lifeline_list = ["Client"] + [k for k, _ in sorted_lifelines[:max_lifelines]] + ["Other"]
-        other_index = len(lifeline_list) - 1
-    else:
-        lifeline_list = ["Client"] + [k for k, _ in sorted_lifelines]
-        other_index = None
+    for i, flow in enumerate(sorted_flows):
+        url = flow.get("url", "")
+        # A null method shows as '?', like a missing one
+        method = flow.get("method") or "?"
+        method = _METHODS.get(method, method)
+        request_ids = flow.get("request_ids", [])
+        response_ids = flow.get("response_ids", [])
 
-    # Map lifeline keys to column indices
-    lifeline_index_map: dict[str, int] = {}
-    for i, ll in enumerate(lifeline_list):
-        if ll != "Client" and ll != "Other":
-            lifeline_index_map[ll] = i
-
-    # Map each flow to its lifeline column
-    flow_lifeline_map: list[int] = []
-    for key in flow_keys:
-        if key in lifeline_index_map:
-            flow_lifeline_map.append(lifeline_index_map[key])
-        elif other_index is not None:
-            flow_lifeline_map.append(other_index)
-        else:
-            # Shouldn't happen, but fallback to last column
-            flow_lifeline_map.append(len(lifeline_list) - 1)
+        parts = url_parts.get((method, url))
+        if parts is None:
+            parsed = urlparse(url)
+            key = _format_lifeline_key(method, parsed.netloc, normalize_path(parsed.path))
+            path = parsed.path or "/"
+            parts = url_parts[(method, url)] = (key, path, _format_arrow_label(method, url, path))
+        key, path, label_html = parts
 
-    # Build flow data with path info
-    flows_data = []
-    for flow in sorted_flows:
-        url = flow.get("url", "")
-        parsed_path = urlparse(url).path or "/"
+        flow_keys.append(key)
         flows_data.append({
-            "method": flow.get("method", "?"),
-            "url": url,
-            "path": parsed_path,
-            "timestamp": flow.get("timestamp", ""),
-            "request_ids": flow.get("request_ids", []),
-            "response_ids": flow.get("response_ids", []),
+            "method": method,
+            "path": path,
+            "label_html": label_html,
+            "time": _format_time(flow.get("timestamp", "")),
+            "request_ids": request_ids,
+            "response_ids": response_ids,
         })
 
-    # Build IDOR values list
-    idor_values = [item.get("id_value", "") for item in potential_idor]
-
-    # Build ID info for summary panel
-    id_info: dict[str, dict[str, Any]] = {}
-
-    # Collect all ID values seen across all flows
-    for i, flow in enumerate(sorted_flows):
-        for res_id in flow.get("response_ids", []):
+        # Collect all ID values seen across all flows
+        for res_id in response_ids:
             val = res_id.get("value", "")
             if val and val not in id_info:
                 id_info[val] = {
@@ -115,16 +201,43 @@ def _build_sequence_data(
                     "origin_flow": i,
                     "usage_count": 0,
                 }
-        for req_id in flow.get("request_ids", []):
+        for req_id in request_ids:
             val = req_id.get("value", "")
             if val:
-                if val not in id_info:
-                    id_info[val] = {
+                # One hash lookup when already seen (the common case); no
+                # throwaway default dict as dict.setdefault would build
+                info = id_info.get(val)
+                if info is None:
+                    info = id_info[val] = {
                         "type": req_id.get("type", "?"),
                         "origin_flow": None,
                         "usage_count": 0,
                     }
-                id_info[val]["usage_count"] += 1
+                info["usage_count"] += 1
+
+    # Count flows per lifeline key to find top endpoints
+    lifeline_counts = Counter(flow_keys)
+
+    # Take top N by frequency (heap selection, no full sort)
+    top_lifelines = [k for k, _ in lifeline_counts.most_common(max_lifelines)]
+
+    if len(lifeline_counts) > max_lifelines:
+        lifeline_list = ["Client"] + top_lifelines + ["Other"]
+        other_index = len(lifeline_list) - 1
+    else:
+        lifeline_list = ["Client"] + top_lifelines
+        other_index = None
+
+    # Map lifeline keys to column indices; unlisted keys go to "Other"
+    # (or, which shouldn't happen, the last column)
+    lifeline_index_map = {
+        ll: i for i, ll in enumerate(lifeline_list) if ll != "Client" and ll != "Other"
+    }
+    fallback_index = other_index if other_index is not None else len(lifeline_list) - 1
+    flow_lifeline_map = [lifeline_index_map.get(key, fallback_index) for key in flow_keys]
+
+    # Build IDOR values list
+    idor_values = [item.get("id_value", "") for item in potential_idor]
 
     # Supplement with tracked_ids data
     for id_val, id_data in tracked_ids.items():
@@ -146,6 +259,129 @@ def _build_sequence_data(
     }
 
 
+def _render_headers_html(lifelines: list[str]) -> str:
+    """Render the lifeline header cells."""
+    cells = []
+    for i, lifeline in enumerate(lifelines):
+        client_class = " client" if i == 0 else ""
+        cells.append(
+            f'<div class="seq-header-cell{client_class}">'
+            f'<span class="lifeline-name" title="{html.escape(lifeline)}">'
+            f"{html.escape(_truncate(lifeline, 22))}</span></div>"
+        )
+    return "".join(cells)
+
+
+def _render_chips_html(
+    ids: list[dict[str, Any]],
+    chip_class: str,
+    idor_set: set[str],
+    value_index: dict[str, int],
+) -> str:
+    """Render the ID chips for one arrow, collapsing extras into '+N'.
+
+    Chips carry their ID value as ``data-vi``, an index into value_index
+    (extended with values not seen yet), rather than as escaped text.
+    """
+    parts = []
+    for id_item in ids[:_MAX_CHIP_DISPLAY]:
+        val = str(id_item.get("value") or "")
+        field = id_item.get("field")
+        label = _truncate(str(field) if field else val, 12)
+        location = id_item.get("location")
+        title = f"{val} ({location})" if location else val
+        idor_class = " idor" if val in idor_set else ""
+        vi = value_index.get(val)
+        if vi is None:
+            vi = value_index[val] = len(value_index)
+        parts.append(
+            f'<span class="id-chip {chip_class}{idor_class}"'
+            f' data-vi="{vi}" title="{html.escape(title)}">'
+            f"{html.escape(label)}</span>"
+        )
+    remaining = len(ids) - _MAX_CHIP_DISPLAY
+    if remaining > 0:
+        parts.append(f'<span class="chips-more">+{remaining}</span>')
+    return "".join(parts)
+
+
+def _iter_rows_html(seq_data: dict[str, Any], value_index: dict[str, int]) -> Iterator[str]:
+    """Yield the HTML of each flow row in the sequence diagram.
+
+    Args:
+        seq_data: Output of _build_sequence_data
+        value_index: Chip value -> index table, filled in as rows are rendered
+
+    Yields:
+        One ``.seq-row`` element per flow
+    """
+    idor_set = set(seq_data["idor_values"])
+    # Lifeline cells are identical for every row
+    cells_html = _SEQ_CELL_HTML * len(seq_data["lifelines"])
+
+    for idx, (flow, target_col) in enumerate(zip(seq_data["flows"], seq_data["flow_lifeline_map"])):
+        label_html = f'<div class="seq-arrow-label">{flow["label_html"]}</div>'
+        if target_col > 0:
+            # Request arrow from the client's centre across target_col columns,
+            # then the dashed response arrow back
+            req_ids = flow["request_ids"]
+            res_ids = flow["response_ids"]
+            req_chips = (
+                f'<div class="seq-chips">{_render_chips_html(req_ids, "consumes", idor_set, value_index)}</div>'
+                if req_ids else ""
+            )
+            res_chips = (
+                f'<div class="seq-chips">{_render_chips_html(res_ids, "produces", idor_set, value_index)}</div>'
+                if res_ids else ""
+            )
+            arrow_html = (
+                f'<div class="seq-arrow-container" style="left:{_HALF_COL}px;width:{target_col * _COL_WIDTH}px;">'
+                f'<div class="seq-arrow request" style="width:100%">{label_html}{req_chips}</div>'
+                f'<div class="seq-arrow response" style="width:100%">{res_chips}</div>'
+                "</div>"
+            )
+        else:
+            # Self-call (rare edge case): render as a small loop
+            arrow_html = (
+                f'<div class="seq-arrow-container" style="left:{_HALF_COL}px;width:60px;">'
+                f'<div class="seq-arrow request" style="width:100%">{label_html}</div>'
+                "</div>"
+            )
+        yield (
+            '<div class="seq-row"><div class="seq-row-meta">'
+            f'<span class="seq-row-index">#{idx + 1}</span>'
+            f'<span class="seq-row-time">{flow["time"]}</span></div>'
+            f"{cells_html}{arrow_html}</div>"
+        )
+
+
+def _build_page_data(seq_data: dict[str, Any], value_index: dict[str, int]) -> dict[str, Any]:
+    """Build the data the page's click handlers need.
+
+    The diagram itself is rendered at export time, so the page only gets the
+    chip value table and ID summaries and IDOR values, in compact form:
+    ``values`` lists chip values by their ``data-vi`` index, ``id_info`` maps
+    each value to ``[type, origin, usage_count]`` (origin already formatted)
+    and ``idor_values`` maps each IDOR value to 1 so the parsed object is the
+    membership lookup.
+    """
+    flows = seq_data["flows"]
+    id_info: dict[str, list[Any]] = {}
+    for val, info in seq_data["id_info"].items():
+        origin_flow = info["origin_flow"]
+        if origin_flow is None:
+            origin = "No origin found"
+        else:
+            flow = flows[origin_flow]
+            origin = f"{flow['method'] or '?'} {_truncate(flow['path'] or '/', 25)}"
+        id_info[val] = [info["type"], origin, info["usage_count"]]
+    return {
+        "values": list(value_index),
+        "id_info": id_info,
+        "idor_values": dict.fromkeys(seq_data["idor_values"], 1),
+    }
+
+
 def export_sequence_html(
     output_path: Union[str, Path],
     sorted_flows: list[dict[str, Any]],
@@ -161,60 +397,29 @@ def export_sequence_html(
         potential_idor: Potential IDOR targets from report
     """
     seq_data = _build_sequence_data(sorted_flows, tracked_ids, potential_idor)
-    # Escape for safe embedding in <script> context (prevent </script> injection)
-    seq_json = json.dumps(seq_data).replace("</", r"<\/")
-
-    html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <meta http-equiv="Content-Security-Policy" content="default-src 'none'; script-src 'unsafe-inline'; style-src 'unsafe-inline';">
-    <title>idotaku - API Sequence Diagram</title>
-    <style>
-{SEQUENCE_STYLES}
-    </style>
-</head>
-<body>
-    <div class="seq-panel">
-        <h1>API Sequence Diagram</h1>
-        <div class="security-warning">
-            <strong>Warning:</strong> This report may contain sensitive data extracted from intercepted HTTP traffic
-            (tokens, session IDs, API keys, cookies). Do not share this file publicly.
-        </div>
-        <div class="subtitle">Click any ID chip to highlight all occurrences across the timeline</div>
-        <div id="seq-header" class="seq-header"></div>
-        <div id="seq-body" class="seq-body"></div>
-    </div>
+    value_index: dict[str, int] = {}
 
-    <div class="id-summary-panel" id="id-summary">
-        <div class="panel-header">
-            <span class="panel-title"></span>
-            <span class="panel-close" onclick="clearHighlight()">&times;</span>
-        </div>
-        <div class="panel-row">
-            <span class="panel-label">Type</span>
-            <span class="panel-value" id="summary-type"></span>
-        </div>
-        <div class="panel-row">
-            <span class="panel-label">Origin</span>
-            <span class="panel-value" id="summary-origin"></span>
-        </div>
-        <div class="panel-row">
-            <span class="panel-label">Used in requests</span>
-            <span class="panel-value" id="summary-usage"></span>
-        </div>
-        <span class="idor-badge" id="summary-idor" style="display:none">Potential IDOR</span>
-    </div>
-
-    <div class="hint" id="hint">Click any ID chip to trace parameter flow</div>
-
-    <script>
-{SEQUENCE_SCRIPTS.replace("{sequence_json}", seq_json)}
-    </script>
-</body>
-</html>
-"""
+    if seq_data["flows"]:
+        total_width = len(seq_data["lifelines"]) * _COL_WIDTH + 40
+        width_style = f' style="min-width:{total_width}px;--col-width:{_COL_WIDTH}px"'
+        header_html = _render_headers_html(seq_data["lifelines"])
+    else:
+        width_style = ""
+        header_html = ""
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(html_content)
+    # The diagram is rendered here rather than in the page; rows are streamed
+    # into the file instead of being joined into one large string
+    with open_output(output_path, buffering=1 << 20) as f:
+        f.write(_HTML_HEAD)
+        f.write(f'<div id="seq-header" class="seq-header"{width_style}>{header_html}</div>\n')
+        f.write(f'        <div id="seq-body" class="seq-body"{width_style}>')
+        if seq_data["flows"]:
+            f.writelines(_iter_rows_html(seq_data, value_index))
+        else:
+            f.write(_EMPTY_STATE_HTML)
+        f.write("</div>")
+        f.write(_HTML_PANEL)
+        # Built after the rows, which fill value_index. Escaped for safe
+        # embedding in <script> context (prevent </script> injection)
+        f.write(dumps(_build_page_data(seq_data, value_index)).replace("</", r"<\/"))
+        f.write(_HTML_TAIL)
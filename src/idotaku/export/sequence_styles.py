@@ -74,6 +74,12 @@ body {
     position: relative;
     min-height: 60px;
     align-items: stretch;
+    /* Skip layout/paint for off-screen rows; the clip margin keeps the
+       row meta (left: -4px) and chip shadows from being cut off */
+    content-visibility: auto;
+    contain-intrinsic-size: auto 0 auto 60px;
+    overflow-clip-margin: 8px;
+    opacity: var(--row-dim, 1);
 }
 .seq-row:hover {
     background: rgba(88, 166, 255, 0.03);
@@ -252,6 +258,7 @@ body {
     max-width: 100px;
     overflow: hidden;
     text-overflow: ellipsis;
+    opacity: var(--chip-dim, 1);
     transition: opacity 0.2s, box-shadow 0.2s, transform 0.15s;
 }
 .id-chip.consumes {
@@ -284,13 +291,14 @@ body {
     background: rgba(63, 185, 80, 0.5);
     border-color: #3fb950;
 }
-body.id-dimmed .id-chip:not(.highlighted) {
-    opacity: 0.25;
+/* Dimming is driven by inherited custom properties set on body, so
+   toggling it needs no descendant or :not() selector matching */
+.id-dimmed {
+    --chip-dim: 0.25;
+    --row-dim: 0.5;
 }
-body.id-dimmed .seq-row:not(.row-highlighted) {
-    opacity: 0.5;
-}
-body.id-dimmed .seq-row.row-highlighted {
+.seq-row.row-highlighted {
+    opacity: 1;
     background: rgba(88, 166, 255, 0.05);
 }
 
@@ -6,116 +6,238 @@ format as the mitmproxy tracker output.
 
 from __future__ import annotations
 
+import io
 import json
 import re
-import uuid
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from functools import lru_cache, partial
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
+from sys import intern
 from typing import Any, Optional, Union
-from urllib.parse import urlparse, parse_qs
+from urllib.parse import ParseResult, urlparse, parse_qsl
 
 from .config import IdotakuConfig
+from .utils.jsonio import dumps, loads
 
+try:
+    import ijson
 
-def _should_exclude(value: str, exclude_patterns: list[re.Pattern[str]]) -> bool:
-    """Check if a value should be excluded."""
-    for pattern in exclude_patterns:
-        if pattern.match(value):
-            return True
-    return False
+    _HAS_IJSON = True
+    _JSON_ERRORS: tuple[type[Exception], ...] = (json.JSONDecodeError, ijson.JSONError)
+except ImportError:
+    _HAS_IJSON = False
+    _JSON_ERRORS = (json.JSONDecodeError,)
+
+
+@lru_cache(maxsize=8)
+def _numeric_floor(min_numeric: int) -> tuple[int, str]:
+    """Length and digits of min_numeric, for comparing digit strings without int()."""
+    if min_numeric <= 0:
+        return 0, ""
+    digits = str(min_numeric)
+    return len(digits), digits
 
 
 def _extract_ids_from_text(
     text: str,
     patterns: dict[str, re.Pattern[str]],
-    exclude_patterns: list[re.Pattern[str]],
+    exclude_union: re.Pattern[str],
     min_numeric: int = 100,
 ) -> list[tuple[str, str]]:
     """Extract IDs from text using compiled patterns.
 
+    Each pattern is scanned separately rather than as one combined
+    alternation: patterns may overlap (a UUID also matches the default
+    ``token`` pattern) and every matching type is reported.
+
     Returns:
         List of (id_value, id_type) tuples
     """
-    found = []
+    found: list[tuple[str, str]] = []
+    append = found.append
+    exclude_match = exclude_union.match
     for id_type, pattern in patterns.items():
+        is_numeric = id_type == "numeric"
         for match in pattern.finditer(text):
             value = match.group()
-            if _should_exclude(value, exclude_patterns):
+            if exclude_match(value):
                 continue
-            if id_type == "numeric":
-                try:
-                    if int(value) < min_numeric:
+            if is_numeric:
+                if value.isascii() and value.isdigit() and value[0] != "0":
+                    # Plain digit strings compare by length, then lexically
+                    min_len, min_str = _numeric_floor(min_numeric)
+                    if len(value) < min_len or (len(value) == min_len and value < min_str):
                         continue
-                except ValueError:
-                    continue
-            found.append((value, id_type))
+                else:
+                    try:
+                        if int(value) < min_numeric:
+                            continue
+                    except ValueError:
+                        continue
+            append((value, id_type))
     return found
 
 
 def _extract_ids_from_json(
     data: Any,
     patterns: dict[str, re.Pattern[str]],
-    exclude_patterns: list[re.Pattern[str]],
+    exclude_union: re.Pattern[str],
     min_numeric: int,
     prefix: str = "",
 ) -> list[tuple[str, str, str]]:
-    """Extract IDs from JSON data recursively.
+    """Extract IDs from JSON data.
+
+    Walks the structure with an explicit stack (children pushed in reverse)
+    so results come out in document order without a call per node, and
+    deeply nested bodies cannot hit the recursion limit.
 
     Returns:
         List of (id_value, id_type, field_path) tuples
     """
-    found = []
-    if isinstance(data, dict):
-        for key, value in data.items():
-            field_path = f"{prefix}.{key}" if prefix else key
-            if isinstance(value, (str, int)):
-                for id_value, id_type in _extract_ids_from_text(
-                    str(value), patterns, exclude_patterns, min_numeric
-                ):
-                    found.append((id_value, id_type, field_path))
-            elif isinstance(value, (dict, list)):
-                found.extend(_extract_ids_from_json(
-                    value, patterns, exclude_patterns, min_numeric, field_path
-                ))
-    elif isinstance(data, list):
-        for i, item in enumerate(data):
-            field_path = f"{prefix}[{i}]"
-            found.extend(_extract_ids_from_json(
-                item, patterns, exclude_patterns, min_numeric, field_path
-            ))
+    found: list[tuple[str, str, str]] = []
+    if not isinstance(data, (dict, list)):
+        return found
+    append = found.append
+    stack: list[tuple[Any, str]] = [(data, prefix)]
+    pop = stack.pop
+    extend = stack.extend
+    while stack:
+        node, path = pop()
+        if isinstance(node, dict):
+            extend(reversed([
+                (value, f"{path}.{key}" if path else key)
+                for key, value in node.items()
+                if isinstance(value, (str, int, dict, list))
+            ]))
+        elif isinstance(node, list):
+            extend(reversed([
+                (item, f"{path}[{i}]")
+                for i, item in enumerate(node)
+                if isinstance(item, (dict, list))
+            ]))
+        else:
+            # Scalars are only pushed as dict values
+            for id_value, id_type in _extract_ids_from_text(
+                str(node), patterns, exclude_union, min_numeric
+            ):
+                append((id_value, id_type, path))
     return found
 
 
+@lru_cache(maxsize=4096)
+def _parse_url(url: str) -> ParseResult:
+    """Cached urlparse(); HARs repeat URLs heavily (e.g. polling endpoints)."""
+    return urlparse(url)
+
+
 def _collect_ids_from_url(
-    url: str,
+    parsed: ParseResult,
     patterns: dict[str, re.Pattern[str]],
-    exclude_patterns: list[re.Pattern[str]],
+    exclude_union: re.Pattern[str],
     min_numeric: int,
 ) -> list[dict[str, Any]]:
-    """Collect IDs from URL path and query parameters."""
+    """Collect IDs from the path and query parameters of a parsed URL."""
     found = []
-    parsed = urlparse(url)
 
     for id_value, id_type in _extract_ids_from_text(
-        parsed.path, patterns, exclude_patterns, min_numeric
+        parsed.path, patterns, exclude_union, min_numeric
     ):
         found.append({"value": id_value, "type": id_type, "location": "url_path", "field": None})
 
-    query_params = parse_qs(parsed.query)
-    for param_name, values in query_params.items():
-        for value in values:
+    for param_name, value in parse_qsl(parsed.query):
+        for id_value, id_type in _extract_ids_from_text(
+            value, patterns, exclude_union, min_numeric
+        ):
+            found.append({"value": id_value, "type": id_type, "location": "query", "field": intern(param_name)})
+
+    return found
+
+
+def _extract_ids_from_json_events(
+    events: Iterable[tuple[str, str, Any]],
+    patterns: dict[str, re.Pattern[str]],
+    exclude_union: re.Pattern[str],
+    min_numeric: int,
+) -> list[tuple[str, str, str]]:
+    """Extract IDs from ijson ``(prefix, event, value)`` parse events.
+
+    Produces the same results as _extract_ids_from_json on the parsed
+    document: only string/integer values of object members are scanned, and
+    field paths use the ``a.b[0].c`` form.
+
+    Returns:
+        List of (id_value, id_type, field_path) tuples
+    """
+    found: list[tuple[str, str, str]] = []
+    append = found.append
+    # Open containers as [path, is_array, next index or current key]
+    stack: list[list[Any]] = []
+    for _, event, value in events:
+        if event == "map_key":
+            stack[-1][2] = value
+            continue
+        if event == "end_map" or event == "end_array":
+            stack.pop()
+            continue
+
+        # A value: work out its path from the enclosing container
+        in_object = False
+        if not stack:
+            path = ""
+        else:
+            frame = stack[-1]
+            if frame[1]:
+                path = f"{frame[0]}[{frame[2]}]"
+                frame[2] += 1
+            else:
+                key = frame[2]
+                path = f"{frame[0]}.{key}" if frame[0] else key
+                in_object = True
+
+        if event == "start_map":
+            stack.append([path, False, None])
+        elif event == "start_array":
+            stack.append([path, True, 0])
+        elif in_object and isinstance(value, (str, int)):
+            # Floats (Decimal) and nulls are skipped, as in the tree walk
             for id_value, id_type in _extract_ids_from_text(
-                value, patterns, exclude_patterns, min_numeric
+                str(value), patterns, exclude_union, min_numeric
             ):
-                found.append({"value": id_value, "type": id_type, "location": "query", "field": param_name})
-
+                append((id_value, id_type, path))
     return found
 
 
+def _extract_ids_from_json_body(
+    body_text: str,
+    patterns: dict[str, re.Pattern[str]],
+    exclude_union: re.Pattern[str],
+    min_numeric: int,
+) -> list[tuple[str, str, str]]:
+    """Extract IDs from a JSON body.
+
+    With ijson installed the body is scanned from parse events without
+    building the object tree; otherwise it is loaded with ``json.loads``.
+
+    Raises:
+        ValueError: If the body is not valid JSON
+    """
+    if _HAS_IJSON:
+        events = ijson.parse(io.BytesIO(body_text.encode("utf-8")))
+        return _extract_ids_from_json_events(events, patterns, exclude_union, min_numeric)
+    return _extract_ids_from_json(
+        json.loads(body_text), patterns, exclude_union, min_numeric
+    )
+
+
 def _collect_ids_from_body(
     body_text: str,
     content_type: str,
     patterns: dict[str, re.Pattern[str]],
-    exclude_patterns: list[re.Pattern[str]],
+    exclude_union: re.Pattern[str],
     min_numeric: int,
 ) -> list[dict[str, Any]]:
     """Collect IDs from request/response body."""
@@ -125,98 +247,174 @@ def _collect_ids_from_body(
 
     if "application/json" in content_type:
         try:
-            data = json.loads(body_text)
-            for id_value, id_type, field_name in _extract_ids_from_json(
-                data, patterns, exclude_patterns, min_numeric
+            for id_value, id_type, field_name in _extract_ids_from_json_body(
+                body_text, patterns, exclude_union, min_numeric
             ):
-                found.append({"value": id_value, "type": id_type, "location": "body", "field": field_name})
-        except (json.JSONDecodeError, ValueError):
+                found.append({"value": id_value, "type": id_type, "location": "body", "field": intern(field_name)})
+        except _JSON_ERRORS + (ValueError,):
             for id_value, id_type in _extract_ids_from_text(
-                body_text, patterns, exclude_patterns, min_numeric
+                body_text, patterns, exclude_union, min_numeric
             ):
                 found.append({"value": id_value, "type": id_type, "location": "body", "field": None})
     else:
         for id_value, id_type in _extract_ids_from_text(
-            body_text, patterns, exclude_patterns, min_numeric
+            body_text, patterns, exclude_union, min_numeric
         ):
             found.append({"value": id_value, "type": id_type, "location": "body", "field": None})
 
     return found
 
 
+# Hashable form of the compiled patterns dict, usable as a cache key
+_PatternItems = tuple[tuple[str, re.Pattern[str]], ...]
+
+
+@lru_cache(maxsize=16384)
+def _extract_header_ids(
+    text: str,
+    patterns: _PatternItems,
+    exclude_union: re.Pattern[str],
+    min_numeric: int,
+) -> tuple[tuple[str, str], ...]:
+    """Cached _extract_ids_from_text for header values.
+
+    Header and cookie values repeat heavily across a capture (session
+    cookies, tokens, user agents); bodies are not cached.
+    """
+    return tuple(_extract_ids_from_text(text, dict(patterns), exclude_union, min_numeric))
+
+
+def _header_ids_cookie(
+    value: str,
+    found: list[dict[str, Any]],
+    patterns: _PatternItems,
+    exclude_union: re.Pattern[str],
+    min_numeric: int,
+) -> None:
+    """Cookie: scan each ``name=value`` pair."""
+    for cookie_part in value.split(";"):
+        cookie_part = cookie_part.strip()
+        if "=" in cookie_part:
+            cookie_name, cookie_value = cookie_part.split("=", 1)
+            for id_value, id_type in _extract_header_ids(
+                cookie_value, patterns, exclude_union, min_numeric
+            ):
+                found.append({
+                    "value": id_value, "type": id_type,
+                    "location": "header", "field": intern(f"cookie:{cookie_name.strip()}"),
+                })
+
+
+def _header_ids_set_cookie(
+    value: str,
+    found: list[dict[str, Any]],
+    patterns: _PatternItems,
+    exclude_union: re.Pattern[str],
+    min_numeric: int,
+) -> None:
+    """Set-Cookie: scan the cookie value, ignoring attributes."""
+    cookie_part = value.split(";")[0]
+    if "=" in cookie_part:
+        cookie_name, cookie_value = cookie_part.split("=", 1)
+        for id_value, id_type in _extract_header_ids(
+            cookie_value, patterns, exclude_union, min_numeric
+        ):
+            found.append({
+                "value": id_value, "type": id_type,
+                "location": "header", "field": intern(f"set-cookie:{cookie_name.strip()}"),
+            })
+
+
+def _header_ids_authorization(
+    value: str,
+    found: list[dict[str, Any]],
+    patterns: _PatternItems,
+    exclude_union: re.Pattern[str],
+    min_numeric: int,
+) -> None:
+    """Authorization: scan the credentials after the scheme."""
+    parts = value.split(" ", 1)
+    auth_value = parts[1] if len(parts) > 1 else value
+    for id_value, id_type in _extract_header_ids(
+        auth_value, patterns, exclude_union, min_numeric
+    ):
+        field = f"authorization:{parts[0].lower()}" if len(parts) > 1 else "authorization"
+        found.append({
+            "value": id_value, "type": id_type,
+            "location": "header", "field": intern(field),
+        })
+
+
+def _header_ids_default(
+    name_lower: str,
+    value: str,
+    found: list[dict[str, Any]],
+    patterns: _PatternItems,
+    exclude_union: re.Pattern[str],
+    min_numeric: int,
+) -> None:
+    """Any other header: scan the whole value."""
+    for id_value, id_type in _extract_header_ids(
+        value, patterns, exclude_union, min_numeric
+    ):
+        found.append({
+            "value": id_value, "type": id_type,
+            "location": "header", "field": intern(name_lower),
+        })
+
+
+# Lowercased header name -> ID collector; other headers use _header_ids_default
+_HEADER_HANDLERS = {
+    "cookie": _header_ids_cookie,
+    "set-cookie": _header_ids_set_cookie,
+    "authorization": _header_ids_authorization,
+}
+
+
 def _collect_ids_from_headers(
     headers: list[dict[str, Any]],
     patterns: dict[str, re.Pattern[str]],
-    exclude_patterns: list[re.Pattern[str]],
+    exclude_union: re.Pattern[str],
     min_numeric: int,
     ignore_headers: set[str],
 ) -> list[dict[str, Any]]:
     """Collect IDs from HAR-format headers ([{name, value}])."""
-    found = []
+    found: list[dict[str, Any]] = []
+    get_handler = _HEADER_HANDLERS.get
+    pattern_items = tuple(patterns.items())
     for header in headers:
-        name = header.get("name", "")
-        value = header.get("value", "")
-        name_lower = name.lower()
-
+        name_lower = header.get("name", "").lower()
         if name_lower in ignore_headers:
             continue
-
-        if name_lower == "cookie":
-            for cookie_part in value.split(";"):
-                cookie_part = cookie_part.strip()
-                if "=" in cookie_part:
-                    cookie_name, cookie_value = cookie_part.split("=", 1)
-                    for id_value, id_type in _extract_ids_from_text(
-                        cookie_value, patterns, exclude_patterns, min_numeric
-                    ):
-                        found.append({
-                            "value": id_value, "type": id_type,
-                            "location": "header", "field": f"cookie:{cookie_name.strip()}",
-                        })
-        elif name_lower == "set-cookie":
-            cookie_part = value.split(";")[0]
-            if "=" in cookie_part:
-                cookie_name, cookie_value = cookie_part.split("=", 1)
-                for id_value, id_type in _extract_ids_from_text(
-                    cookie_value, patterns, exclude_patterns, min_numeric
-                ):
-                    found.append({
-                        "value": id_value, "type": id_type,
-                        "location": "header", "field": f"set-cookie:{cookie_name.strip()}",
-                    })
-        elif name_lower == "authorization":
-            parts = value.split(" ", 1)
-            auth_value = parts[1] if len(parts) > 1 else value
-            for id_value, id_type in _extract_ids_from_text(
-                auth_value, patterns, exclude_patterns, min_numeric
-            ):
-                field = f"authorization:{parts[0].lower()}" if len(parts) > 1 else "authorization"
-                found.append({
-                    "value": id_value, "type": id_type,
-                    "location": "header", "field": field,
-                })
+        value = header.get("value", "")
+        handler = get_handler(name_lower)
+        if handler is None:
+            _header_ids_default(
+                name_lower, value, found, pattern_items, exclude_union, min_numeric
+            )
         else:
-            for id_value, id_type in _extract_ids_from_text(
-                value, patterns, exclude_patterns, min_numeric
-            ):
-                found.append({
-                    "value": id_value, "type": id_type,
-                    "location": "header", "field": name_lower,
-                })
+            handler(value, found, pattern_items, exclude_union, min_numeric)
 
     return found
 
 
 def _parse_har_entry(
     entry: dict[str, Any],
+    index: int,
     patterns: dict[str, re.Pattern[str]],
-    exclude_patterns: list[re.Pattern[str]],
+    exclude_union: re.Pattern[str],
     min_numeric: int,
     ignore_headers: set[str],
     config: IdotakuConfig,
+    ct_matcher: Callable[[str], re.Match[str] | None],
 ) -> Optional[dict[str, Any]]:
     """Parse a single HAR entry into a flow record dict.
 
+    The flow ID is the entry's position in the HAR as 8 hex digits, which
+    keeps IDs unique within the report however entries are scheduled.
+
+    ``ct_matcher`` searches a MIME type for any trackable content type.
+
     Returns:
         Flow record dict, or None if the entry should be skipped.
     """
@@ -225,7 +423,7 @@ def _parse_har_entry(
     url = request.get("url", "")
 
     # Domain filtering
-    parsed_url = urlparse(url)
+    parsed_url = _parse_url(url)
     domain = parsed_url.netloc
     if config.target_domains or config.exclude_domains:
         if not config.should_track_domain(domain):
@@ -236,38 +434,38 @@ def _parse_har_entry(
         return None
 
     timestamp = entry.get("startedDateTime", "")
-    method = request.get("method", "GET")
-    flow_id = str(uuid.uuid4())[:8]
+    method = intern(request.get("method", "GET"))
+    flow_id = f"{index:08x}"
 
     # Collect request IDs
     request_ids = []
-    request_ids.extend(_collect_ids_from_url(url, patterns, exclude_patterns, min_numeric))
+    request_ids.extend(_collect_ids_from_url(parsed_url, patterns, exclude_union, min_numeric))
     request_ids.extend(_collect_ids_from_headers(
-        request.get("headers", []), patterns, exclude_patterns, min_numeric, ignore_headers
+        request.get("headers", []), patterns, exclude_union, min_numeric, ignore_headers
     ))
 
     req_body = request.get("postData", {})
     if req_body:
         req_content_type = req_body.get("mimeType", "")
         req_text = req_body.get("text", "")
-        if req_text and any(ct in req_content_type for ct in config.trackable_content_types):
+        if req_text and ct_matcher(req_content_type):
             request_ids.extend(_collect_ids_from_body(
-                req_text, req_content_type, patterns, exclude_patterns, min_numeric
+                req_text, req_content_type, patterns, exclude_union, min_numeric
             ))
 
     # Collect response IDs
     response_ids = []
     response_ids.extend(_collect_ids_from_headers(
-        response.get("headers", []), patterns, exclude_patterns, min_numeric, ignore_headers
+        response.get("headers", []), patterns, exclude_union, min_numeric, ignore_headers
     ))
 
     res_content = response.get("content", {})
     if res_content:
         res_content_type = res_content.get("mimeType", "")
         res_text = res_content.get("text", "")
-        if res_text and any(ct in res_content_type for ct in config.trackable_content_types):
+        if res_text and ct_matcher(res_content_type):
             response_ids.extend(_collect_ids_from_body(
-                res_text, res_content_type, patterns, exclude_patterns, min_numeric
+                res_text, res_content_type, patterns, exclude_union, min_numeric
             ))
 
     # Store full request/response data
@@ -313,14 +511,27 @@ def _parse_har_entry(
     }
 
 
-def _build_tracked_ids(flows: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+def _build_tracked_ids(
+    flows: list[dict[str, Any]],
+    no_origin: dict[str, None] | None = None,
+) -> dict[str, dict[str, Any]]:
     """Build tracked_ids dict from flow records.
 
     Follows the same origin/usage logic as IDTracker:
     - Response IDs set the origin (first occurrence)
     - Request IDs are recorded as usages
+
+    Args:
+        flows: Flow records, in timestamp order
+        no_origin: Optional dict filled (as an ordered set) with the IDs that
+            have usages but no origin, in tracked_ids order
+
+    Returns:
+        tracked_ids dict
     """
     tracked: dict[str, dict[str, Any]] = {}
+    if no_origin is None:
+        no_origin = {}
 
     for flow in flows:
         timestamp = flow.get("timestamp", "")
@@ -332,16 +543,18 @@ def _build_tracked_ids(flows: list[dict[str, Any]]) -> dict[str, dict[str, Any]]
             value = id_info.get("value", "")
             if not value:
                 continue
-            if value not in tracked:
-                tracked[value] = {
+            rec = tracked.get(value)
+            if rec is None:
+                rec = tracked[value] = {
                     "type": id_info.get("type", "unknown"),
                     "first_seen": timestamp,
                     "origin": None,
                     "usage_count": 0,
                     "usages": [],
                 }
-            if tracked[value]["origin"] is None:
-                tracked[value]["origin"] = {
+            if rec["origin"] is None:
+                no_origin.pop(value, None)
+                rec["origin"] = {
                     "url": url,
                     "method": method,
                     "location": id_info.get("location", "?"),
@@ -354,8 +567,9 @@ def _build_tracked_ids(flows: list[dict[str, Any]]) -> dict[str, dict[str, Any]]
             value = id_info.get("value", "")
             if not value:
                 continue
-            if value not in tracked:
-                tracked[value] = {
+            rec = tracked.get(value)
+            if rec is None:
+                rec = tracked[value] = {
                     "type": id_info.get("type", "unknown"),
                     "first_seen": timestamp,
                     "origin": None,
@@ -369,19 +583,27 @@ def _build_tracked_ids(flows: list[dict[str, Any]]) -> dict[str, dict[str, Any]]
                 "field_name": id_info.get("field"),
                 "timestamp": timestamp,
             }
-            tracked[value]["usages"].append(usage)
-            tracked[value]["usage_count"] = len(tracked[value]["usages"])
+            rec["usages"].append(usage)
+            rec["usage_count"] += 1
+            if rec["origin"] is None:
+                no_origin[value] = None
 
     return tracked
 
 
-def _build_potential_idor(tracked_ids: dict[str, dict[str, Any]]) -> list[dict[str, Any]]:
+def _build_potential_idor(
+    tracked_ids: dict[str, dict[str, Any]],
+    candidates: Iterable[str] | None = None,
+) -> list[dict[str, Any]]:
     """Build potential_idor list from tracked_ids.
 
     Same logic as IDTracker: IDs used in requests but never seen in responses.
+    ``candidates`` (the no_origin IDs collected by _build_tracked_ids) limits
+    the check to those IDs instead of scanning every tracked ID.
     """
     idor = []
-    for id_value, info in tracked_ids.items():
+    for id_value in tracked_ids if candidates is None else candidates:
+        info = tracked_ids[id_value]
         if info["usages"] and info["origin"] is None:
             idor.append({
                 "id_value": id_value,
@@ -392,50 +614,153 @@ def _build_potential_idor(tracked_ids: dict[str, dict[str, Any]]) -> list[dict[s
     return idor
 
 
+def _iter_har_entries(har_path: str | Path) -> Iterator[Any]:
+    """Yield the entries of a HAR file.
+
+    With ijson installed (``pip install idotaku[speedups]``) entries are
+    streamed one at a time, so memory stays bounded on large archives.
+    Otherwise the whole file is loaded with the stdlib parser.
+
+    Raises:
+        ValueError: If the file cannot be read or is not valid JSON
+    """
+    try:
+        if _HAS_IJSON:
+            with open(har_path, "rb") as f:
+                yield from ijson.items(f, "log.entries.item", use_float=True)
+            return
+        with open(har_path, "rb") as f:
+            har_data = loads(f.read())
+    except _JSON_ERRORS as e:
+        raise ValueError(f"Invalid JSON in HAR file '{har_path}': {e}") from e
+    except OSError as e:
+        raise ValueError(f"Cannot read HAR file '{har_path}': {e}") from e
+
+    yield from har_data.get("log", {}).get("entries", [])
+
+
+# Entries sent to a worker process per task when importing in parallel
+_CHUNK_SIZE = 1000
+
+_EntryParser = Callable[[Any, int], dict[str, Any] | None]
+
+# Set in each pool worker by _init_worker
+_worker_parse: _EntryParser | None = None
+
+
+def _make_entry_parser(config: IdotakuConfig) -> _EntryParser:
+    """Bind _parse_har_entry to the compiled settings of a config."""
+    # One regex search per body instead of an any() over the substrings;
+    # an empty list has to match nothing rather than everything
+    ct_matcher = re.compile(
+        "|".join(re.escape(ct) for ct in config.trackable_content_types) or "(?!)"
+    ).search
+    return partial(
+        _parse_har_entry,
+        patterns=config.get_compiled_patterns(),
+        exclude_union=config.get_compiled_exclude_union(),
+        min_numeric=config.min_numeric,
+        ignore_headers=config.get_all_ignore_headers(),
+        config=config,
+        ct_matcher=ct_matcher,
+    )
+
+
+def _init_worker(config: IdotakuConfig) -> None:
+    """Process pool initializer: compile the config once per worker."""
+    global _worker_parse
+    _worker_parse = _make_entry_parser(config)
+
+
+def _parse_entry_chunk(entries: list[tuple[int, Any]]) -> list[dict[str, Any]]:
+    """Parse a chunk of (index, entry) pairs in a pool worker, dropping skipped ones."""
+    parse = _worker_parse
+    if parse is None:
+        raise RuntimeError("HAR worker used before _init_worker")
+    return [
+        flow for index, entry in entries
+        if (flow := parse(entry, index)) is not None
+    ]
+
+
+def _chunked(items: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    """Yield lists of up to ``size`` items."""
+    it = iter(items)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
+
+def _map_bounded(
+    executor: Executor,
+    fn: Callable[[Any], Any],
+    items: Iterable[Any],
+    window: int,
+) -> Iterator[Any]:
+    """Like ``executor.map``, but with at most ``window`` tasks in flight.
+
+    ``Executor.map`` submits every item up front, which would pull the whole
+    HAR through the streaming reader before the first result comes back.
+    Results are yielded in submission order.
+    """
+    it = iter(items)
+    pending: deque[Future[Any]] = deque(
+        executor.submit(fn, item) for item in islice(it, window)
+    )
+    while pending:
+        result = pending.popleft().result()
+        # Refill before yielding so the pool stays busy while the caller works
+        for item in islice(it, 1):
+            pending.append(executor.submit(fn, item))
+        yield result
+
+
 def import_har(
     har_path: Union[str, Path],
     config: Optional[IdotakuConfig] = None,
+    workers: int = 1,
 ) -> dict[str, Any]:
     """Import a HAR file and produce a report dict.
 
     Args:
         har_path: Path to HAR JSON file
         config: Optional IdotakuConfig for ID extraction settings
+        workers: Number of processes parsing entries; above 1, entries are
+            parsed in chunks by a process pool
 
     Returns:
         Report dict in the same format as IDTracker.generate_report()
     """
     config = config or IdotakuConfig()
-    patterns = config.get_compiled_patterns()
-    exclude_patterns = config.get_compiled_exclude_patterns()
-    ignore_headers = config.get_all_ignore_headers()
-
-    try:
-        with open(har_path, "r", encoding="utf-8") as f:
-            har_data = json.load(f)
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Invalid JSON in HAR file '{har_path}': {e}") from e
-    except OSError as e:
-        raise ValueError(f"Cannot read HAR file '{har_path}': {e}") from e
-
-    entries = har_data.get("log", {}).get("entries", [])
 
     # Parse entries into flows
-    flows = []
-    for entry in entries:
-        flow = _parse_har_entry(
-            entry, patterns, exclude_patterns,
-            config.min_numeric, ignore_headers, config,
-        )
-        if flow is not None:
-            flows.append(flow)
-
-    # Sort by timestamp
-    flows.sort(key=lambda x: x.get("timestamp", ""))
+    flows: list[dict[str, Any]] = []
+    entries = _iter_har_entries(har_path)
+    if workers > 1:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(config,),
+        ) as executor:
+            for chunk_flows in _map_bounded(
+                executor,
+                _parse_entry_chunk,
+                _chunked(enumerate(entries), _CHUNK_SIZE),
+                2 * workers,
+            ):
+                flows.extend(chunk_flows)
+    else:
+        parse = _make_entry_parser(config)
+        for index, entry in enumerate(entries):
+            flow = parse(entry, index)
+            if flow is not None:
+                flows.append(flow)
+
+    # Sort by timestamp; every flow has the key, and browser HARs are usually
+    # already in order, which the sort detects as a single run
+    flows.sort(key=itemgetter("timestamp"))
 
     # Build tracked IDs and detect IDOR
-    tracked_ids = _build_tracked_ids(flows)
-    potential_idor = _build_potential_idor(tracked_ids)
+    no_origin: dict[str, None] = {}
+    tracked_ids = _build_tracked_ids(flows, no_origin)
+    potential_idor = _build_potential_idor(tracked_ids, no_origin)
 
     return {
         "summary": {
@@ -454,15 +779,16 @@ def import_har_to_file(
     har_path: Union[str, Path],
     output_path: Union[str, Path],
     config: Optional[IdotakuConfig] = None,
+    workers: int = 1,
 ) -> dict[str, Any]:
     """Import HAR and write report JSON file.
 
     Returns:
         The report dict
     """
-    report = import_har(har_path, config)
+    report = import_har(har_path, config, workers)
 
     with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(report, f, indent=2, ensure_ascii=False)
+        f.write(dumps(report, pretty=True))
 
     return report
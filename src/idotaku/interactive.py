@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import heapq
+import os
 from pathlib import Path
 from collections import Counter
 from typing import Any, cast
@@ -25,7 +27,7 @@ STYLE = Style([
 ])
 
 
-COMMANDS = [
+COMMANDS = (
     {"value": "proxy", "name": "proxy       - Start tracking proxy (launch browser)"},
     {"value": "import-har", "name": "import-har  - Import HAR file to generate report"},
     {"value": "chain", "name": "chain       - Analyze parameter chains (main flows)"},
@@ -39,12 +41,34 @@ COMMANDS = [
     {"value": "csv", "name": "csv         - Export report to CSV"},
     {"value": "sarif", "name": "sarif       - Export findings to SARIF format"},
     {"value": "config", "name": "config      - Manage config (init/show/validate)"},
-]
+)
+
+# Actions offered by the config command
+CONFIG_ACTIONS = (
+    {"value": "setup", "name": "setup    - Edit settings interactively"},
+    {"value": "init", "name": "init     - Create default config file"},
+    {"value": "show", "name": "show     - Show effective configuration"},
+    {"value": "validate", "name": "validate - Validate config file"},
+)
 
 # Analysis commands that require a report file
-ANALYSIS_COMMANDS = {
+ANALYSIS_COMMANDS = frozenset({
     "chain", "sequence", "lifeline", "report",
     "score", "verify", "auth", "csv", "sarif",
+})
+
+# Analysis commands run in-process on the report already loaded by the
+# prompt loop (name of the entrypoint in idotaku.commands); the others
+# go through the click CLI
+DIRECT_COMMANDS = {
+    "chain": "run_chain",
+    "sequence": "run_sequence",
+    "lifeline": "run_lifeline",
+    "report": "run_report",
+    "score": "run_score",
+    "auth": "run_auth",
+    "csv": "run_csv_export",
+    "sarif": "run_sarif_export",
 }
 
 
@@ -61,8 +85,14 @@ def prompt_command() -> str | None:
 
 def prompt_report_file(default: str = "id_tracker_report.json") -> str | None:
     """Prompt user to select or enter a report file."""
-    # Find JSON files in current directory
-    json_files = list(Path.cwd().glob("*.json"))
+    # Find JSON files in current directory (glob-style: dotfiles skipped)
+    with os.scandir(Path.cwd()) as it:
+        json_files = [
+            e for e in it
+            if not e.name.startswith(".")
+            and os.path.normcase(e.name).endswith(".json")
+            and e.is_file()
+        ]
 
     if not json_files:
         # No JSON files found, ask for path
@@ -72,17 +102,17 @@ def prompt_report_file(default: str = "id_tracker_report.json") -> str | None:
             style=STYLE,
         ).ask())
 
-    # Sort by modification time (newest first)
-    json_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
+    # Newest 10 by modification time; DirEntry caches its stat() result
+    newest = heapq.nlargest(10, json_files, key=lambda e: e.stat().st_mtime)
 
     # Build choices with file info
     choices = []
-    for f in json_files[:10]:  # Limit to 10 files
-        size = f.stat().st_size
+    for e in newest:
+        size = e.stat().st_size
         size_str = f"{size / 1024:.1f}KB" if size > 1024 else f"{size}B"
         choices.append({
-            "value": str(f),
-            "name": f"{f.name} ({size_str})",
+            "value": e.path,
+            "name": f"{e.name} ({size_str})",
         })
 
     choices.append({"value": "__other__", "name": "Other (enter path)..."})
@@ -113,13 +143,14 @@ def prompt_domains(flows: list[dict[str, Any]], min_flows: int = 10) -> list[str
     Returns:
         List of selected domains, empty list for no filter, None if cancelled
     """
-    # Count domains
+    # Count domains: tally URLs first (Counter counts in C), then resolve
+    # each distinct URL's domain once
+    url_counts = Counter(flow.get("url", "") for flow in flows)
     domain_counts: Counter[str] = Counter()
-    for flow in flows:
-        url = flow.get("url", "")
+    for url, count in url_counts.items():
         domain = extract_domain(url)
         if domain:
-            domain_counts[domain] += 1
+            domain_counts[domain] += count
 
     if len(domain_counts) <= 1:
         # Only one domain, no need to filter
@@ -383,12 +414,7 @@ def run_interactive_mode() -> None:
         if command == "config":
             config_action = questionary.select(
                 "Config action:",
-                choices=[
-                    {"value": "setup", "name": "setup    - Edit settings interactively"},
-                    {"value": "init", "name": "init     - Create default config file"},
-                    {"value": "show", "name": "show     - Show effective configuration"},
-                    {"value": "validate", "name": "validate - Validate config file"},
-                ],
+                choices=CONFIG_ACTIONS,
                 style=STYLE,
             ).ask()
 
@@ -440,8 +466,9 @@ def run_interactive_mode() -> None:
                 console.print("[yellow]No flows found in report.[/yellow]")
                 continue
 
-            # Build command arguments
+            # Build command arguments (and the matching entrypoint options)
             args = [command, report_file]
+            options: dict[str, Any] = {}
 
             # Domain filter for chain command
             if command == "chain":
@@ -450,13 +477,15 @@ def run_interactive_mode() -> None:
                     console.print("\n[dim]Cancelled.[/dim]")
                     break
                 if domains:
-                    args.extend(["--domains", ",".join(domains)])
+                    options["domains"] = ",".join(domains)
+                    args.extend(["--domains", options["domains"]])
 
             # HTML output for chain/sequence
             if command in ("chain", "sequence"):
                 default_name = f"{command}.html"
                 html_output = prompt_html_output(default=default_name)
                 if html_output:
+                    options["html_output"] = html_output
                     args.extend(["--html", html_output])
 
             # Execute command
@@ -464,13 +493,21 @@ def run_interactive_mode() -> None:
             console.print(f"[dim]Running: idotaku {' '.join(args[1:])}[/dim]")
             console.print()
 
-            import click
-            from .cli import main
-            from click.testing import CliRunner
-
-            runner = CliRunner()
-            result = runner.invoke(main, args, catch_exceptions=False, color=True)
-            click.echo(result.output, nl=False)
+            if command in DIRECT_COMMANDS:
+                from . import commands
+
+                try:
+                    getattr(commands, DIRECT_COMMANDS[command])(data, **options)
+                except SystemExit:
+                    pass  # The command already reported the error
+            else:
+                import click
+                from .cli import main
+                from click.testing import CliRunner
+
+                runner = CliRunner()
+                result = runner.invoke(main, args, catch_exceptions=False, color=True)
+                click.echo(result.output, nl=False)
 
             # Continue?
             console.print()
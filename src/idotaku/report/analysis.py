@@ -2,39 +2,79 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from collections import defaultdict
+from itertools import islice
+from operator import itemgetter
 from typing import Any
 from urllib.parse import urlparse
 
 
-def build_param_producer_consumer(
+def _url_path(url: str) -> str:
+    """Return ``urlparse(url).path or "/"`` without building a ParseResult.
+
+    Plain http(s) URLs are sliced with str.find; anything urlparse would
+    treat specially (``;params``, control characters or whitespace, other
+    schemes, non-string values) goes through urlparse itself.
+    """
+    if (
+        isinstance(url, str)
+        and url.startswith(("https://", "http://"))
+        and ";" not in url
+        and url.isprintable()
+    ):
+        end = url.find("?")
+        if end == -1:
+            end = len(url)
+        fragment = url.find("#", 0, end)
+        if fragment != -1:
+            end = fragment
+        slash = url.find("/", 8 if url[4] == "s" else 7, end)
+        return url[slash:end] if slash != -1 else "/"
+    return urlparse(url).path or "/"
+
+
+def build_param_indexes(
     sorted_flows: list[dict[str, Any]],
-) -> tuple[dict[str, dict[str, Any]], dict[str, list[dict[str, Any]]]]:
-    """Build param producer and consumer mappings.
+) -> tuple[
+    dict[str, dict[str, Any]],
+    dict[str, list[dict[str, Any]]],
+    dict[str, list[int]],
+    dict[str, list[int]],
+    dict[int, list[str]],
+]:
+    """Build all param mappings in a single pass over the flows.
+
+    Combines build_param_producer_consumer and build_param_flow_mappings for
+    callers that need both, reading each flow and parsing its URL once.
 
     Args:
         sorted_flows: List of flow records sorted by timestamp
 
     Returns:
-        Tuple of (param_producer, param_consumers):
-        - param_producer: dict mapping param_value to producer info
-          {param: {"idx": flow_idx, "method": str, "path": str, "field": str}}
-        - param_consumers: defaultdict mapping param_value to list of consumer info
-          {param: [{"idx": flow_idx, "method": str, "path": str, "field": str}, ...]}
+        Tuple of (param_producer, param_consumers, param_origins,
+        param_usages, flow_produces), as returned by the two functions above
     """
     param_producer: dict[str, dict[str, Any]] = {}
     param_consumers: dict[str, list[dict[str, Any]]] = defaultdict(list)
+    param_origins: dict[str, list[int]] = defaultdict(list)
+    param_usages: dict[str, list[int]] = defaultdict(list)
+    flow_produces: dict[int, list[str]] = defaultdict(list)
 
     for i, flow in enumerate(sorted_flows):
         method = flow.get("method", "?")
-        url = flow.get("url", "?")
-        path = urlparse(url).path or "/"
+        path = _url_path(flow.get("url", "?"))
+        produces = None
 
         # Track producers (first response)
         for res_id in flow.get("response_ids", []):
             val = res_id.get("value", "")
             if not val:
                 continue
+            param_origins[val].append(i)
+            if produces is None:
+                produces = flow_produces[i]
+            produces.append(val)
             if val not in param_producer:
                 param_producer[val] = {
                     "idx": i,
@@ -48,6 +88,7 @@ def build_param_producer_consumer(
             val = req_id.get("value", "")
             if not val:
                 continue
+            param_usages[val].append(i)
             param_consumers[val].append({
                 "idx": i,
                 "method": method,
@@ -55,6 +96,25 @@ def build_param_producer_consumer(
                 "field": req_id.get("field") or req_id.get("location"),
             })
 
+    return param_producer, param_consumers, param_origins, param_usages, flow_produces
+
+
+def build_param_producer_consumer(
+    sorted_flows: list[dict[str, Any]],
+) -> tuple[dict[str, dict[str, Any]], dict[str, list[dict[str, Any]]]]:
+    """Build param producer and consumer mappings.
+
+    Args:
+        sorted_flows: List of flow records sorted by timestamp
+
+    Returns:
+        Tuple of (param_producer, param_consumers):
+        - param_producer: dict mapping param_value to producer info
+          {param: {"idx": flow_idx, "method": str, "path": str, "field": str}}
+        - param_consumers: defaultdict mapping param_value to list of consumer info
+          {param: [{"idx": flow_idx, "method": str, "path": str, "field": str}, ...]}
+    """
+    param_producer, param_consumers, _, _, _ = build_param_indexes(sorted_flows)
     return param_producer, param_consumers
 
 
@@ -71,6 +131,9 @@ def build_param_flow_mappings(
         - param_origins: defaultdict[param, list[flow_idx]] - all producers of each param
         - param_usages: defaultdict[param, list[flow_idx]] - all consumers of each param
         - flow_produces: defaultdict[flow_idx, list[param]] - params produced by each flow
+
+    Needs no URL parsing; use build_param_indexes when the producer/consumer
+    mappings are needed as well.
     """
     param_origins: dict[str, list[int]] = defaultdict(list)
     param_usages: dict[str, list[int]] = defaultdict(list)
@@ -109,20 +172,30 @@ def build_flow_graph(
     Returns:
         Flow graph: dict[origin_idx, list[(usage_idx, [params])]]
     """
-    # Build raw graph with param grouping
-    flow_graph_raw: dict[int, dict[int, list[str]]] = defaultdict(lambda: defaultdict(list))
+    # Build raw graph with param grouping: origin_idx -> usage_idx -> params
+    flow_graph_raw: dict[int, dict[int, list[str]]] = {}
 
     for param, origin_idxs in param_origins.items():
+        usage_idxs = param_usages.get(param)
+        if not usage_idxs:
+            continue
         for origin_idx in origin_idxs:
-            for usage_idx in param_usages.get(param, []):
-                if usage_idx != origin_idx:  # Prevent self-loops only
-                    flow_graph_raw[origin_idx][usage_idx].append(param)
+            usages = flow_graph_raw.get(origin_idx)
+            for usage_idx in usage_idxs:
+                if usage_idx == origin_idx:  # Prevent self-loops only
+                    continue
+                if usages is None:
+                    usages = flow_graph_raw[origin_idx] = {}
+                params = usages.get(usage_idx)
+                if params is None:
+                    usages[usage_idx] = [param]
+                else:
+                    params.append(param)
 
     # Convert to list format with sorted edges
     flow_graph: dict[int, list[tuple[int, list[str]]]] = defaultdict(list)
     for origin_idx, usages in flow_graph_raw.items():
-        for usage_idx, params in sorted(usages.items()):
-            flow_graph[origin_idx].append((usage_idx, params))
+        flow_graph[origin_idx] = sorted(usages.items())
 
     return flow_graph
 
@@ -135,6 +208,10 @@ def build_api_dependencies(
 
     Creates a mapping showing which APIs produce parameters consumed by other APIs.
 
+    Consumer lists must be in ascending ``idx`` order, as
+    build_param_producer_consumer builds them, so the forward consumers of
+    each producer are found with a binary search.
+
     Args:
         param_producer: Producer mapping from build_param_producer_consumer
         param_consumers: Consumer mapping from build_param_producer_consumer
@@ -146,18 +223,27 @@ def build_api_dependencies(
     api_deps: dict[str, dict[str, list[dict[str, Any]]]] = defaultdict(
         lambda: defaultdict(list)
     )
+    # "METHOD path" keys, built once per distinct endpoint
+    api_keys: dict[tuple[Any, Any], str] = {}
+
+    def api_key(info: dict[str, Any]) -> str:
+        endpoint = (info["method"], info["path"])
+        key = api_keys.get(endpoint)
+        if key is None:
+            key = api_keys[endpoint] = f"{endpoint[0]} {endpoint[1]}"
+        return key
 
     for param_val, producer in param_producer.items():
-        if param_val not in param_consumers:
+        consumers = param_consumers.get(param_val)
+        if not consumers:
             continue
 
-        producer_key = f"{producer['method']} {producer['path']}"
+        producer_key = api_key(producer)
 
-        for consumer in param_consumers[param_val]:
-            if consumer["idx"] <= producer["idx"]:
-                continue  # Only forward dependencies
-
-            consumer_key = f"{consumer['method']} {consumer['path']}"
+        # Only forward dependencies: skip consumers at or before the producer
+        start = bisect_right(consumers, producer["idx"], key=itemgetter("idx"))
+        for consumer in islice(consumers, start, None):
+            consumer_key = api_key(consumer)
 
             if consumer_key != producer_key:  # Don't self-reference
                 api_deps[producer_key][param_val].append({
@@ -211,6 +297,77 @@ def build_id_transition_map(
     return id_to_origin, id_to_subsequent_usage
 
 
+def _acyclic_tree_stats(
+    flow_graph: dict[int, list[tuple[int, list[str]]]],
+) -> dict[int, tuple[int, int]]:
+    """Compute (depth, node_count) for every flow that cannot reach a cycle.
+
+    Runs Tarjan's SCC algorithm iteratively. Components are completed
+    successors-first, so a flow whose component is a single node gets its
+    stats from its already finished successors in O(V + E) overall. Flows
+    that can reach a cycle are left out; their chain trees depend on the
+    path taken to them.
+    """
+    index: dict[int, int] = {}
+    low: dict[int, int] = {}
+    on_stack: set[int] = set()
+    scc_stack: list[int] = []
+    stats: dict[int, tuple[int, int]] = {}
+    edges = flow_graph.get
+
+    for start in list(flow_graph):
+        if start in index:
+            continue
+        index[start] = low[start] = len(index)
+        scc_stack.append(start)
+        on_stack.add(start)
+        work = [(start, iter(edges(start, ())))]
+
+        while work:
+            flow_idx, children = work[-1]
+            for next_idx, _ in children:
+                if next_idx not in index:
+                    index[next_idx] = low[next_idx] = len(index)
+                    scc_stack.append(next_idx)
+                    on_stack.add(next_idx)
+                    work.append((next_idx, iter(edges(next_idx, ()))))
+                    break
+                if next_idx in on_stack and index[next_idx] < low[flow_idx]:
+                    low[flow_idx] = index[next_idx]
+            else:
+                # All children done: finish this flow
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[flow_idx])
+                if low[flow_idx] != index[flow_idx]:
+                    continue
+
+                member = scc_stack.pop()
+                on_stack.discard(member)
+                if member != flow_idx:
+                    # Multi-flow component: a cycle, so no fixed stats
+                    while member != flow_idx:
+                        member = scc_stack.pop()
+                        on_stack.discard(member)
+                    continue
+
+                depth = 0
+                count = 1
+                for next_idx, _ in edges(flow_idx, ()):
+                    if next_idx == flow_idx:
+                        continue
+                    child = stats.get(next_idx)
+                    if child is None:
+                        break  # successor reaches a cycle
+                    depth = max(depth, child[0])
+                    count += child[1]
+                else:
+                    stats[flow_idx] = (1 + depth, count)
+
+    return stats
+
+
 def find_chain_roots(
     flow_graph: dict[int, list[tuple[int, list[str]]]],
     flow_produces: dict[int, list[str]],
@@ -219,6 +376,12 @@ def find_chain_roots(
 ) -> list[tuple[int, int, int]]:
     """Find and rank root flows for chain trees.
 
+    Depth is the longest simple path (in flows) from the root and node count
+    is the size of the tree of simple paths below it. Both come from a
+    memoized bottom-up pass wherever no cycle is reachable; only flows that
+    can reach a cycle are walked path by path, on an explicit stack so long
+    chains cannot hit the recursion limit.
+
     Args:
         flow_graph: Flow graph from build_flow_graph
         flow_produces: Flow produces mapping
@@ -228,37 +391,45 @@ def find_chain_roots(
     Returns:
         List of (flow_idx, depth, node_count) tuples, sorted by depth*nodes descending
     """
-    def calc_tree_depth(flow_idx: int, visited: set[int]) -> int:
-        """Calculate maximum tree depth from a flow."""
-        if flow_idx in visited:
-            return 0
-        visited.add(flow_idx)
-
-        max_child_depth = 0
-        for next_idx, _ in flow_graph.get(flow_idx, []):
-            child_depth = calc_tree_depth(next_idx, visited.copy())
-            max_child_depth = max(max_child_depth, child_depth)
-
-        return 1 + max_child_depth
-
-    def count_tree_nodes(flow_idx: int, visited: set[int]) -> int:
-        """Count total nodes in tree."""
-        if flow_idx in visited:
-            return 0
-        visited.add(flow_idx)
-
-        count = 1
-        for next_idx, _ in flow_graph.get(flow_idx, []):
-            count += count_tree_nodes(next_idx, visited.copy())
-        return count
+    acyclic = _acyclic_tree_stats(flow_graph)
+
+    def tree_stats(root: int) -> tuple[int, int]:
+        """(depth, node_count) of the simple-path tree from a flow."""
+        known = acyclic.get(root)
+        if known is not None:
+            return known
+        path = {root}
+        # Frames: [flow_idx, remaining edges, max child depth, node count]
+        stack: list[list[Any]] = [[root, iter(flow_graph.get(root, ())), 0, 1]]
+        while True:
+            frame = stack[-1]
+            for next_idx, _ in frame[1]:
+                if next_idx in path:
+                    continue
+                known = acyclic.get(next_idx)
+                if known is not None:
+                    frame[2] = max(frame[2], known[0])
+                    frame[3] += known[1]
+                    continue
+                path.add(next_idx)
+                stack.append([next_idx, iter(flow_graph.get(next_idx, ())), 0, 1])
+                break
+            else:
+                stack.pop()
+                path.discard(frame[0])
+                depth = 1 + frame[2]
+                if not stack:
+                    return depth, frame[3]
+                parent = stack[-1]
+                parent[2] = max(parent[2], depth)
+                parent[3] += frame[3]
 
     # Find root candidates (flows that produce params and have outgoing edges)
     root_candidates: list[tuple[int, int, int]] = []
     for flow_idx in flow_produces.keys():
         if flow_idx in flow_graph:
-            depth = calc_tree_depth(flow_idx, set())
+            depth, node_count = tree_stats(flow_idx)
             if depth >= min_depth:
-                node_count = count_tree_nodes(flow_idx, set())
                 root_candidates.append((flow_idx, depth, node_count))
 
     # Sort by depth * node_count (importance score)
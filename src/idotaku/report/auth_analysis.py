@@ -1,13 +1,12 @@
 """Auth context analysis for cross-user IDOR detection."""
 
-from collections import defaultdict
 from dataclasses import dataclass, field
 from typing import Any
 
 from ..utils.url import normalize_api_path
 
 
-@dataclass
+@dataclass(slots=True)
 class CrossUserAccess:
     """A case where different auth contexts access the same resource with the same ID."""
 
@@ -17,6 +16,19 @@ class CrossUserAccess:
     flows: list[dict[str, Any]] = field(default_factory=list)
 
 
+@dataclass(slots=True)
+class _AccessEntry:
+    """Accesses seen for one (id_value, url_pattern) key.
+
+    The token set is only allocated once a second distinct token shows
+    up, so the common single-user keys stay small.
+    """
+
+    first_token: str
+    flow_idxs: list[int]
+    tokens: set[str] | None = None
+
+
 def detect_cross_user_access(flows: list[dict[str, Any]]) -> list[CrossUserAccess]:
     """Detect cases where different auth tokens access the same resource with the same ID.
 
@@ -26,38 +38,50 @@ def detect_cross_user_access(flows: list[dict[str, Any]]) -> list[CrossUserAcces
     Returns:
         List of CrossUserAccess instances
     """
-    access_map: dict[tuple[str, str], dict[str, Any]] = defaultdict(
-        lambda: {"tokens": set(), "flows": []}
-    )
+    # Keyed by (id_value, url_pattern); flows are kept as indexes into
+    # ``flows`` and only resolved for the cases that cross users
+    access_map: dict[tuple[str, str], _AccessEntry] = {}
 
-    for flow in flows:
+    for flow_idx, flow in enumerate(flows):
         auth = flow.get("auth_context")
         if not auth or not auth.get("token_hash"):
             continue
 
         token_hash = auth["token_hash"]
+        url_pattern = ""
 
         for req_id in flow.get("request_ids", []):
             id_value = req_id.get("value", "")
             if not id_value:
                 continue
-            url = flow.get("url", "")
-            method = flow.get("method", "?")
-            url_pattern = f"{method} {normalize_api_path(url)}"
+            if not url_pattern:
+                url = flow.get("url", "")
+                method = flow.get("method", "?")
+                url_pattern = f"{method} {normalize_api_path(url)}"
 
             key = (id_value, url_pattern)
-            access_map[key]["tokens"].add(token_hash)
-            access_map[key]["flows"].append(flow)
+            entry = access_map.get(key)
+            if entry is None:
+                access_map[key] = _AccessEntry(token_hash, [flow_idx])
+                continue
 
-    # Filter to cases with multiple auth tokens
+            if entry.tokens is not None:
+                entry.tokens.add(token_hash)
+            elif token_hash != entry.first_token:
+                entry.tokens = {entry.first_token, token_hash}
+            # The same ID can appear in several request_ids of one flow
+            if entry.flow_idxs[-1] != flow_idx:
+                entry.flow_idxs.append(flow_idx)
+
+    # Keep only the cases with multiple auth tokens
     results = []
-    for (id_value, url_pattern), data in access_map.items():
-        if len(data["tokens"]) > 1:
+    for (id_value, url_pattern), entry in access_map.items():
+        if entry.tokens is not None:
             results.append(CrossUserAccess(
                 id_value=id_value,
                 url_pattern=url_pattern,
-                auth_tokens=sorted(data["tokens"]),
-                flows=data["flows"],
+                auth_tokens=sorted(entry.tokens),
+                flows=[flows[i] for i in entry.flow_idxs],
             ))
 
     return results
@@ -70,18 +94,18 @@ def enrich_idor_with_auth(
     """Enrich IDOR findings with cross-user access info.
 
     Adds 'cross_user': True and 'auth_tokens' to findings that
-    show cross-user access patterns.
+    show cross-user access patterns. Matching findings are copied;
+    the rest are passed through as the same dict objects.
     """
     cross_user_map = {ca.id_value: ca for ca in cross_user_accesses}
 
     enriched = []
     for finding in potential_idor:
-        finding = {**finding}
         id_val = finding.get("id_value", "")
-        if id_val and id_val in cross_user_map:
-            ca = cross_user_map[id_val]
-            finding["cross_user"] = True
-            finding["auth_tokens"] = ca.auth_tokens
-        enriched.append(finding)
+        ca = cross_user_map.get(id_val) if id_val else None
+        if ca is None:
+            enriched.append(finding)
+            continue
+        enriched.append({**finding, "cross_user": True, "auth_tokens": ca.auth_tokens})
 
     return enriched
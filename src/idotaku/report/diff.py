@@ -8,7 +8,7 @@ from typing import Any
 from .models import IDORFindingDict, ReportData
 
 
-@dataclass
+@dataclass(slots=True)
 class DiffResult:
     """Structured diff between two reports."""
 
@@ -53,13 +53,16 @@ def diff_reports(report_a: ReportData, report_b: ReportData) -> DiffResult:
     idor_a = {item.get("id_value", ""): item for item in report_a.potential_idor if item.get("id_value")}
     idor_b = {item.get("id_value", ""): item for item in report_b.potential_idor if item.get("id_value")}
 
-    new_idor = [idor_b[k] for k in idor_b if k not in idor_a]
-    removed_idor = [idor_a[k] for k in idor_a if k not in idor_b]
-    unchanged_idor = [idor_b[k] for k in idor_b if k in idor_a]
+    # One pass over each side, keeping report order (set algebra would not)
+    new_idor: list[IDORFindingDict] = []
+    unchanged_idor: list[IDORFindingDict] = []
+    for k, item in idor_b.items():
+        (unchanged_idor if k in idor_a else new_idor).append(item)
+    removed_idor = [item for k, item in idor_a.items() if k not in idor_b]
 
-    # Compare tracked IDs
-    ids_a = set(report_a.tracked_ids.keys())
-    ids_b = set(report_b.tracked_ids.keys())
+    # Compare tracked IDs (key views support set difference directly)
+    ids_a = report_a.tracked_ids.keys()
+    ids_b = report_b.tracked_ids.keys()
 
     return DiffResult(
         new_idor=new_idor,
@@ -7,6 +7,7 @@ import sys
 from pathlib import Path
 from typing import Union
 
+from ..utils.jsonio import loads
 from .models import ReportData, ReportSummary
 
 
@@ -37,8 +38,7 @@ def load_report(
     report_path = Path(report_file)
 
     try:
-        with open(report_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = loads(report_path.read_bytes())
     except json.JSONDecodeError as e:
         msg = f"Invalid JSON in report file '{report_path}': {e}"
         if exit_on_error:
@@ -144,30 +144,30 @@ class ReportData:
     flows: list[FlowDict]
     potential_idor: list[IDORFindingDict]
 
-    # Cached derived data
-    _sorted_flows: list[FlowDict] = field(default_factory=list, repr=False)
-    _idor_values: set[str] = field(default_factory=set, repr=False)
-
-    def __post_init__(self) -> None:
-        """Initialize cached derived data."""
-        self._sorted_flows = sorted(
-            self.flows, key=lambda x: x.get("timestamp", "")
-        )
-        self._idor_values = {
-            item.get("id_value", "") for item in self.potential_idor
-            if item.get("id_value")
-        }
+    # Derived data, built on first access so commands that never need it
+    # skip the extra pass over flows / findings
+    _sorted_flows: list[FlowDict] | None = field(default=None, repr=False, compare=False)
+    _idor_values: set[str] | None = field(default=None, repr=False, compare=False)
 
     @property
     def sorted_flows(self) -> list[FlowDict]:
         """Get flows sorted by timestamp."""
+        if self._sorted_flows is None:
+            self._sorted_flows = sorted(
+                self.flows, key=lambda x: x.get("timestamp", "")
+            )
         return self._sorted_flows
 
     @property
     def idor_values(self) -> set[str]:
         """Get set of potential IDOR ID values."""
+        if self._idor_values is None:
+            self._idor_values = {
+                item.get("id_value", "") for item in self.potential_idor
+                if item.get("id_value")
+            }
         return self._idor_values
 
     def is_idor(self, id_value: str) -> bool:
         """Check if an ID is a potential IDOR target."""
-        return id_value in self._idor_values
+        return id_value in self.idor_values
@@ -1,10 +1,11 @@
 """Utility functions for idotaku."""
 
-from .url import normalize_api_path, extract_domain, get_base_domain
+from .url import normalize_api_path, normalize_path, extract_domain, get_base_domain
 from .formatting import truncate_text, truncate_id
 
 __all__ = [
     "normalize_api_path",
+    "normalize_path",
     "extract_domain",
     "get_base_domain",
     "truncate_text",
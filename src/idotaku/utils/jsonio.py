@@ -0,0 +1,65 @@
+"""JSON (de)serialization helpers with an optional orjson fast path for output."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Mapping
+from typing import Any
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+
+def _default(obj: Any) -> Any:
+    """Serialize read-only mappings (e.g. MappingProxyType) as objects."""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any, pretty: bool = False) -> str:
+    """Serialize an object to JSON text, keeping non-ASCII characters as-is.
+
+    Uses orjson when it is installed (``pip install idotaku[speedups]``) and
+    falls back to the stdlib encoder otherwise, or when orjson rejects the
+    data (e.g. integers wider than 64 bits).
+
+    Args:
+        obj: JSON-serializable object
+        pretty: Indent with 2 spaces instead of emitting compact output
+
+    Returns:
+        JSON text
+    """
+    if _HAS_ORJSON:
+        try:
+            option = orjson.OPT_INDENT_2 if pretty else 0
+            return orjson.dumps(obj, default=_default, option=option).decode("utf-8")
+        except TypeError:
+            pass
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=_default)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=_default)
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON text or UTF-8 bytes.
+
+    Always uses the stdlib decoder: orjson decodes integers wider than
+    64 bits as floats, which would silently corrupt large IDs, and its
+    parsing lead is small enough that checking its output costs more.
+
+    Args:
+        data: JSON document
+
+    Returns:
+        Parsed object
+
+    Raises:
+        json.JSONDecodeError: If the data is not valid JSON
+    """
+    return json.loads(data)
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from urllib.parse import urlparse
 
 
+@lru_cache(maxsize=8192)
 def normalize_api_path(url: str) -> str:
     """Normalize URL path by replacing ID-like segments with placeholders.
 
@@ -20,8 +22,23 @@ def normalize_api_path(url: str) -> str:
     Returns:
         Normalized path with ID placeholders
     """
-    path = urlparse(url).path or "/"
-    segments = path.split("/")
+    return normalize_path(urlparse(url).path)
+
+
+@lru_cache(maxsize=4096)
+def normalize_path(path: str) -> str:
+    """Normalize an already-parsed URL path (see normalize_api_path).
+
+    Lets callers that already hold a parsed URL skip a second urlparse().
+    Results are cached since captures hit the same endpoints repeatedly.
+
+    Args:
+        path: Path component of a URL
+
+    Returns:
+        Normalized path with ID placeholders
+    """
+    segments = (path or "/").split("/")
     normalized: list[str] = []
 
     for seg in segments:
@@ -58,8 +75,13 @@ def extract_domain(url: str) -> str:
     """
     if not url or not isinstance(url, str):
         return ""
-    parsed = urlparse(url)
-    return parsed.netloc or ""
+    return _extract_netloc(url)
+
+
+@lru_cache(maxsize=8192)
+def _extract_netloc(url: str) -> str:
+    """Cached netloc lookup behind extract_domain's type guard."""
+    return urlparse(url).netloc or ""
 
 
 def get_base_domain(domain: str) -> str:
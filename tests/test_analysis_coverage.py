@@ -1,12 +1,17 @@
 """Tests for analysis.py edge cases to improve coverage of src/idotaku/report/analysis.py."""
 
+from urllib.parse import urlparse
+
+import pytest
 
 from idotaku.report.analysis import (
     build_param_producer_consumer,
     build_param_flow_mappings,
+    build_param_indexes,
     build_api_dependencies,
     build_id_transition_map,
     find_chain_roots,
+    _url_path,
 )
 
 
@@ -225,6 +230,62 @@ class TestBuildParamFlowMappingsEdgeCases:
         assert "abc" in produces[0]
 
 
+# ---------------------------------------------------------------------------
+# _url_path
+# ---------------------------------------------------------------------------
+
+
+class TestUrlPath:
+    """_url_path matches urlparse(url).path or "/"."""
+
+    @pytest.mark.parametrize("url", [
+        "https://api.example.com/users/1?x=1#f",
+        "http://api.example.com",
+        "https://api.example.com?next=/a/b",
+        "https://api.example.com#/route",
+        "https://api.example.com/a;v=1/b",
+        "https://api.example.com/a\tb",
+        " https://api.example.com/a",
+        "/relative/path?x=1",
+        "ftp://files.example.com/pub",
+        "?",
+        "",
+    ])
+    def test_matches_urlparse(self, url):
+        assert _url_path(url) == (urlparse(url).path or "/")
+
+
+# ---------------------------------------------------------------------------
+# build_param_indexes
+# ---------------------------------------------------------------------------
+
+
+class TestBuildParamIndexes:
+    """build_param_indexes matches the separate builders."""
+
+    def test_matches_separate_builders(self):
+        flows = [
+            {
+                "method": "POST", "url": "https://api.example.com/users",
+                "request_ids": [{"value": "", "location": "body"}],
+                "response_ids": [
+                    {"value": "100", "location": "body", "field": "id"},
+                    {"value": "200", "location": "header"},
+                ],
+            },
+            {"method": "GET", "url": "https://api.example.com/health"},
+            {
+                "method": "GET", "url": "https://api.example.com/users/100?x=1",
+                "request_ids": [{"value": "100", "location": "url_path"}],
+                "response_ids": [{"value": "100", "location": "body", "field": "id"}],
+            },
+        ]
+        indexes = build_param_indexes(flows)
+        assert indexes[:2] == build_param_producer_consumer(flows)
+        assert indexes[2:] == build_param_flow_mappings(flows)
+        assert dict(indexes[4]) == {0: ["100", "200"], 2: ["100"]}
+
+
 # ---------------------------------------------------------------------------
 # build_api_dependencies edge cases
 # ---------------------------------------------------------------------------
@@ -312,6 +373,28 @@ class TestBuildApiDependenciesEdgeCases:
         # Producer at idx=0, consumer at idx=1 => forward dep, included
         assert len(deps) > 0
 
+    def test_only_later_consumers_kept_in_order(self):
+        """Consumers at or before the producer are skipped; the rest keep their order."""
+        producer = {"abc": {"method": "POST", "path": "/create", "idx": 2}}
+        consumers = {
+            "abc": [
+                {"method": "GET", "path": "/a", "field": "f0", "idx": 0},
+                {"method": "GET", "path": "/b", "field": "f2", "idx": 2},
+                {"method": "GET", "path": "/c", "field": "f3", "idx": 3},
+                {"method": "POST", "path": "/create", "field": "f4", "idx": 4},
+                {"method": "GET", "path": "/a", "field": "f5", "idx": 5},
+            ],
+        }
+        deps = build_api_dependencies(producer, consumers)
+        assert deps == {
+            "POST /create": {
+                "abc": [
+                    {"api": "GET /c", "field": "f3"},
+                    {"api": "GET /a", "field": "f5"},
+                ],
+            },
+        }
+
 
 # ---------------------------------------------------------------------------
 # build_id_transition_map edge cases
@@ -505,3 +588,32 @@ class TestFindChainRootsEdgeCases:
         score_first = roots[0][1] * roots[0][2]
         score_second = roots[1][1] * roots[1][2]
         assert score_first >= score_second
+
+    def test_diamond_counts_tree_paths(self):
+        """Shared descendants count once per path, as in the rendered tree."""
+        # 0->1, 0->2, 1->3, 2->3: tree is 0, 1, 3, 2, 3
+        flow_graph = {0: [(1, ["p"]), (2, ["p"])], 1: [(3, ["q"])], 2: [(3, ["q"])]}
+        flow_produces = {0: ["p"], 1: ["q"], 2: ["q"]}
+        roots = find_chain_roots(flow_graph, flow_produces, [], min_depth=2)
+        assert roots[0] == (0, 3, 5)
+
+    def test_cycle_feeding_acyclic_tail(self):
+        """Path-dependent stats through a cycle, memoized stats after it."""
+        # 0<->1, 1->2->3
+        flow_graph = {0: [(1, ["a"])], 1: [(0, ["b"]), (2, ["c"])], 2: [(3, ["d"])]}
+        flow_produces = {0: ["a"], 1: ["b", "c"], 2: ["d"]}
+        roots = find_chain_roots(flow_graph, flow_produces, [], min_depth=1)
+        assert sorted(roots) == [(0, 4, 4), (1, 3, 4), (2, 2, 2)]
+
+    def test_long_chain_no_recursion_limit(self):
+        """Chains longer than the recursion limit are handled."""
+        flow_graph = {i: [(i + 1, ["p"])] for i in range(5000)}
+        roots = find_chain_roots(flow_graph, {0: ["p"]}, [], min_depth=2)
+        assert roots == [(0, 5001, 5001)]
+
+    def test_long_cycle_no_recursion_limit(self):
+        """Long chains that loop back are walked without recursion."""
+        flow_graph = {i: [(i + 1, ["p"])] for i in range(4999)}
+        flow_graph[4999] = [(0, ["p"])]
+        roots = find_chain_roots(flow_graph, {0: ["p"]}, [], min_depth=2)
+        assert roots == [(0, 5000, 5000)]
@@ -99,6 +99,37 @@ class TestDetectCrossUserAccess:
         result = detect_cross_user_access([])
         assert len(result) == 0
 
+    def test_flow_listed_once_per_case(self, flows_with_cross_user):
+        # The same ID in both the path and the query of one request
+        flows_with_cross_user[0]["request_ids"].append(
+            {"value": "12345", "type": "numeric", "location": "query"}
+        )
+        result = detect_cross_user_access(flows_with_cross_user)
+        assert len(result) == 1
+        assert result[0].flows == flows_with_cross_user
+        assert result[0].flows[0] is flows_with_cross_user[0]
+
+    def test_earlier_single_user_flows_kept(self):
+        def flow(id_value, token):
+            return {
+                "method": "GET",
+                "url": f"https://api.example.com/items/{id_value}",
+                "request_ids": [{"value": id_value, "type": "numeric", "location": "url_path"}],
+                "auth_context": {"auth_type": "Bearer", "token_hash": token},
+            }
+
+        flows = [
+            flow("111", "aa"), flow("222", "aa"), flow("111", "aa"),
+            flow("222", "bb"), flow("111", "cc"), flow("333", "aa"),
+        ]
+        result = detect_cross_user_access(flows)
+        # Reported in first-seen order, with the flows from before the
+        # second token appeared
+        assert [ca.id_value for ca in result] == ["111", "222"]
+        assert result[0].auth_tokens == ["aa", "cc"]
+        assert result[0].flows == [flows[0], flows[2], flows[4]]
+        assert result[1].flows == [flows[1], flows[3]]
+
 
 class TestEnrichIdorWithAuth:
     def test_adds_cross_user_flag(self, flows_with_cross_user):
@@ -129,3 +160,16 @@ class TestEnrichIdorWithAuth:
 
         # Original should not be modified
         assert "cross_user" not in findings[0]
+
+    def test_unmatched_findings_passed_through(self, flows_with_cross_user):
+        findings = [
+            {"id_value": "12345", "id_type": "numeric", "reason": "test", "usages": []},
+            {"id_value": "other", "id_type": "token", "reason": "test", "usages": []},
+            {"id_type": "numeric", "reason": "no value", "usages": []},
+        ]
+        cross_user = detect_cross_user_access(flows_with_cross_user)
+        enriched = enrich_idor_with_auth(findings, cross_user)
+
+        assert enriched[0] is not findings[0]
+        assert enriched[1] is findings[1]
+        assert enriched[2] is findings[2]
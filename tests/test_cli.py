@@ -387,6 +387,14 @@ class TestSarifCommand:
         result = runner.invoke(main, ["sarif", str(empty_report_file), "-o", str(output)])
         assert result.exit_code == 0
 
+    def test_sarif_pretty(self, runner, sample_report_file, tmp_path):
+        output = tmp_path / "pretty.sarif.json"
+        result = runner.invoke(
+            main, ["sarif", str(sample_report_file), "-o", str(output), "--pretty"]
+        )
+        assert result.exit_code == 0
+        assert output.read_text(encoding="utf-8").count("\n") > 1
+
 
 class TestHarImportCommand:
     """Tests for import-har command."""
@@ -432,3 +440,10 @@ class TestHarImportCommand:
         result = runner.invoke(main, ["import-har", str(har_file)])
         assert result.exit_code == 1
         assert "Error" in result.output
+
+    def test_har_import_invalid_workers(self, runner, tmp_path):
+        har_file = tmp_path / "test.har"
+        har_file.write_text('{"log": {"entries": []}}')
+
+        result = runner.invoke(main, ["import-har", str(har_file), "--workers", "0"])
+        assert result.exit_code == 2
@@ -78,6 +78,34 @@ class TestIdotakuConfigMethods:
         timestamp_pattern = compiled[0]
         assert timestamp_pattern.match("1234567890123")
 
+    def test_get_compiled_exclude_union(self):
+        """Union matches whenever any single exclude pattern matches."""
+        config = IdotakuConfig()
+        union = config.get_compiled_exclude_union()
+
+        assert union.match("1234567890123")
+        assert union.match("1.2.3")
+        assert not union.match("12345")
+
+    def test_get_compiled_exclude_union_inline_flags(self):
+        """Leading inline flags stay scoped to their own pattern."""
+        config = IdotakuConfig()
+        config.exclude_patterns = ["(?i)^test$", "^abc$"]
+        union = config.get_compiled_exclude_union()
+
+        assert union.match("TEST")
+        assert union.match("abc")
+        assert not union.match("ABC")
+
+    def test_get_compiled_exclude_union_empty(self):
+        """No exclude patterns means nothing is excluded."""
+        config = IdotakuConfig()
+        config.exclude_patterns = []
+        union = config.get_compiled_exclude_union()
+
+        assert not union.match("")
+        assert not union.match("12345")
+
     def test_get_all_ignore_headers(self):
         """Test combined ignore headers."""
         config = IdotakuConfig()
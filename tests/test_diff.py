@@ -6,6 +6,7 @@ import pytest
 
 from idotaku.report.diff import diff_reports, diff_to_dict
 from idotaku.report.loader import load_report
+from idotaku.report.models import ReportData, ReportSummary
 
 
 @pytest.fixture
@@ -81,6 +82,20 @@ class TestDiffReports:
         result = diff_reports(data_a, data_b)
         assert result.has_changes
 
+    def test_idor_lists_keep_report_order(self):
+        def report(values):
+            return ReportData(
+                summary=ReportSummary(),
+                tracked_ids={},
+                flows=[],
+                potential_idor=[{"id_value": v} for v in values],
+            )
+
+        result = diff_reports(report(["e", "a", "d", "b"]), report(["z", "d", "y", "a", "x"]))
+        assert [i["id_value"] for i in result.new_idor] == ["z", "y", "x"]
+        assert [i["id_value"] for i in result.unchanged_idor] == ["d", "a"]
+        assert [i["id_value"] for i in result.removed_idor] == ["e", "b"]
+
 
 class TestDiffToDict:
     def test_serializable(self, sample_report_file, modified_report_file):
@@ -5,9 +5,11 @@ import pytest
 from idotaku.export.chain_exporter import (
     _get_flow_details,
     _get_api_key,
+    _pack_trees,
     export_chain_html,
 )
 from idotaku.export.html_base import html_escape
+from idotaku.export.html_styles import _minify_css
 
 
 class TestGetFlowDetails:
@@ -82,6 +84,64 @@ class TestGetApiKey:
         assert "{uuid}" in key
 
 
+class TestPackTrees:
+    """Tests for _pack_trees function."""
+
+    def test_columns_and_string_table(self):
+        """Test that nodes become parallel columns with shared strings."""
+        trees = [{
+            "flow_idx": 0, "index": 1, "via_params": None,
+            "method": "POST", "url": "https://a.com/users", "domain": "a.com", "path": "/users",
+            "request_ids": [],
+            "response_ids": [{"value": "7", "type": "numeric", "location": "body", "field": "id"}],
+            "children": [{
+                "flow_idx": 1, "index": 2, "via_params": ["7"],
+                "method": "GET", "url": "https://a.com/users/7", "domain": "a.com",
+                "path": "/users/7",
+                "request_ids": [{"value": "7", "type": "numeric", "location": "path"}],
+                "response_ids": [],
+                "children": [],
+            }],
+            "rank": 1, "depth": 2, "nodes": 2,
+        }]
+
+        packed = _pack_trees(trees)
+        s = packed["s"]
+
+        assert packed["fl"] == [0, 0]
+        assert packed["ix"] == [1, 2]
+        assert packed["cs"] == [1, 2]
+        assert packed["cc"] == [1, 0]
+        assert [s[i] for i in packed["m"]] == ["POST", "GET"]
+        assert s.count("a.com") == 1
+        assert s.count("7") == 1
+        value, id_type, location, field = packed["q"][1]
+        assert (s[value], s[id_type], s[location], field) == ("7", "numeric", "path", -1)
+        assert packed["rt"] == [[0, 1, 2, 2]]
+
+    def test_cycle_ref_and_from_cycle_flags(self):
+        """Test that cycle refs and continued nodes are flagged."""
+        trees = [{
+            "flow_idx": 0, "index": 1, "via_params": None,
+            "method": "GET", "url": "?", "domain": "", "path": "/",
+            "request_ids": [], "response_ids": [],
+            "children": [
+                {"type": "cycle_ref", "flow_idx": 0, "target_index": "?", "via_params": ["x"]},
+                {
+                    "flow_idx": 2, "index": 2, "via_params": ["y"], "from_cycle": True,
+                    "method": "GET", "url": "?", "domain": "", "path": "/",
+                    "request_ids": [], "response_ids": [], "children": [],
+                },
+            ],
+        }]
+
+        packed = _pack_trees(trees)
+
+        assert packed["fl"] == [0, 1, 2]
+        assert packed["ix"] == [1, -1, 2]
+        assert packed["m"][1] == -1
+
+
 class TestExportChainHtml:
     """Tests for export_chain_html function."""
 
@@ -203,9 +263,8 @@ class TestExportChainHtml:
 
         content = output_file.read_text(encoding="utf-8")
 
-        # Should contain rank markers for both trees
-        assert '"rank": 1' in content or '"rank":1' in content
-        assert '"rank": 2' in content or '"rank":2' in content
+        # Should contain root entries ([node, rank, depth, nodes]) for both trees
+        assert '"rt":[[0,1,3,3],[1,2,1,1]]' in content
 
     def test_empty_roots(self, tmp_path, sample_flows, sample_flow_graph, sample_flow_produces):
         """Test export with no root trees."""
@@ -222,7 +281,25 @@ class TestExportChainHtml:
 
         assert output_file.exists()
         content = output_file.read_text(encoding="utf-8")
-        assert "treesData = []" in content
+        assert '"rt":[]' in content
+
+    def test_trees_json_placeholder_substituted(
+        self, tmp_path, sample_flows, sample_flow_graph, sample_flow_produces
+    ):
+        """Test that the data placeholder is replaced and JS braces are left intact."""
+        output_file = tmp_path / "chain.html"
+
+        export_chain_html(
+            output_file,
+            sample_flows,
+            sample_flow_graph,
+            sample_flow_produces,
+            [(300, 3, 3, 0)],
+        )
+
+        content = output_file.read_text(encoding="utf-8")
+        assert "{trees_json}" not in content
+        assert "function renderTrees() {" in content
 
 
 class TestHtmlEscape:
@@ -241,3 +318,23 @@ class TestHtmlEscape:
     def test_non_string_input(self):
         """Test non-string input."""
         assert html_escape(12345) == "12345"
+
+
+class TestMinifyCss:
+    """Tests for _minify_css function."""
+
+    def test_strips_comments_and_whitespace(self):
+        """Test that comments and formatting whitespace are removed."""
+        css = """
+/* Header */
+.a > .b {
+    margin: 0 auto;
+    color: #fff;
+}
+"""
+        assert _minify_css(css) == ".a>.b{margin:0 auto;color:#fff}"
+
+    def test_keeps_quoted_font_names(self):
+        """Test that spaces inside values are preserved."""
+        css = "body { font-family: 'Segoe UI', sans-serif; }"
+        assert _minify_css(css) == "body{font-family:'Segoe UI',sans-serif}"
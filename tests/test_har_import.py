@@ -1,9 +1,13 @@
 """Tests for HAR import."""
 
 import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
 
 import pytest
 
+import idotaku.import_har as import_har_module
 from idotaku.import_har import (
     import_har,
     import_har_to_file,
@@ -14,6 +18,9 @@ from idotaku.import_har import (
     _collect_ids_from_body,
     _build_tracked_ids,
     _build_potential_idor,
+    _iter_har_entries,
+    _extract_ids_from_json_events,
+    _extract_ids_from_json_body,
 )
 from idotaku.config import IdotakuConfig
 
@@ -27,7 +34,7 @@ def config():
 def compiled(config):
     return {
         "patterns": config.get_compiled_patterns(),
-        "exclude_patterns": config.get_compiled_exclude_patterns(),
+        "exclude_union": config.get_compiled_exclude_union(),
         "min_numeric": config.min_numeric,
     }
 
@@ -123,30 +130,56 @@ class TestExtractIdsFromText:
         values = [v for v, t in result]
         assert "50" not in values
 
+    def test_min_numeric_boundary(self, compiled):
+        compiled["min_numeric"] = 1000
+        values = [v for v, t in _extract_ids_from_text("999 1000 1001 10000", **compiled)
+                  if t == "numeric"]
+        assert values == ["1000", "1001", "10000"]
+
+    def test_min_numeric_leading_zeros(self, compiled):
+        """Values a custom numeric pattern matches are compared as integers."""
+        compiled["patterns"] = {"numeric": re.compile(r"-?\d+")}
+        values = [v for v, t in _extract_ids_from_text("0099 00123 -500 123", **compiled)]
+        assert values == ["00123", "123"]
+
+    def test_overlapping_types_all_reported(self, compiled):
+        value = "550e8400-e29b-41d4-a716-446655440000"
+        result = _extract_ids_from_text(value, **compiled)
+        assert (value, "uuid") in result
+        assert (value, "token") in result
+
 
 class TestCollectIdsFromUrl:
     def test_path_ids(self, compiled):
         result = _collect_ids_from_url(
-            "https://api.example.com/users/12345",
-            compiled["patterns"], compiled["exclude_patterns"], compiled["min_numeric"],
+            urlparse("https://api.example.com/users/12345"),
+            compiled["patterns"], compiled["exclude_union"], compiled["min_numeric"],
         )
         values = [r["value"] for r in result]
         assert "12345" in values
 
     def test_query_ids(self, compiled):
         result = _collect_ids_from_url(
-            "https://api.example.com/search?user_id=67890",
-            compiled["patterns"], compiled["exclude_patterns"], compiled["min_numeric"],
+            urlparse("https://api.example.com/search?user_id=67890"),
+            compiled["patterns"], compiled["exclude_union"], compiled["min_numeric"],
         )
         values = [r["value"] for r in result]
         assert "67890" in values
 
+    def test_repeated_query_params(self, compiled):
+        result = _collect_ids_from_url(
+            urlparse("https://api.example.com/items?id=11111&q=x&id=22222&empty="),
+            compiled["patterns"], compiled["exclude_union"], compiled["min_numeric"],
+        )
+        numeric = [(r["value"], r["field"]) for r in result if r["type"] == "numeric"]
+        assert numeric == [("11111", "id"), ("22222", "id")]
+
 
 class TestCollectIdsFromHeaders:
     def test_cookie_header(self, compiled, config):
         headers = [{"name": "Cookie", "value": "session=abc12345678901234567890"}]
         result = _collect_ids_from_headers(
-            headers, compiled["patterns"], compiled["exclude_patterns"],
+            headers, compiled["patterns"], compiled["exclude_union"],
             compiled["min_numeric"], config.get_all_ignore_headers(),
         )
         assert len(result) >= 0  # May or may not match depending on token pattern
@@ -154,7 +187,7 @@ class TestCollectIdsFromHeaders:
     def test_authorization_header(self, compiled, config):
         headers = [{"name": "Authorization", "value": "Bearer abc12345678901234567890def"}]
         result = _collect_ids_from_headers(
-            headers, compiled["patterns"], compiled["exclude_patterns"],
+            headers, compiled["patterns"], compiled["exclude_union"],
             compiled["min_numeric"], config.get_all_ignore_headers(),
         )
         # Should extract token-like values from Bearer token
@@ -164,7 +197,7 @@ class TestCollectIdsFromHeaders:
         """Test Set-Cookie header parsing."""
         headers = [{"name": "Set-Cookie", "value": "session_id=12345678; Path=/; HttpOnly"}]
         result = _collect_ids_from_headers(
-            headers, compiled["patterns"], compiled["exclude_patterns"],
+            headers, compiled["patterns"], compiled["exclude_union"],
             compiled["min_numeric"], config.get_all_ignore_headers(),
         )
         # Should extract ID from set-cookie value
@@ -178,7 +211,7 @@ class TestCollectIdsFromHeaders:
         """Test regular header containing ID value."""
         headers = [{"name": "X-Request-ID", "value": "550e8400-e29b-41d4-a716-446655440000"}]
         result = _collect_ids_from_headers(
-            headers, compiled["patterns"], compiled["exclude_patterns"],
+            headers, compiled["patterns"], compiled["exclude_union"],
             compiled["min_numeric"], config.get_all_ignore_headers(),
         )
         values = [r["value"] for r in result]
@@ -191,7 +224,7 @@ class TestCollectIdsFromHeaders:
         """Test Authorization header without Bearer/Basic scheme."""
         headers = [{"name": "Authorization", "value": "abc12345678901234567890def"}]
         result = _collect_ids_from_headers(
-            headers, compiled["patterns"], compiled["exclude_patterns"],
+            headers, compiled["patterns"], compiled["exclude_union"],
             compiled["min_numeric"], config.get_all_ignore_headers(),
         )
         # Should use "authorization" as field when no scheme
@@ -199,6 +232,19 @@ class TestCollectIdsFromHeaders:
             fields = [r["field"] for r in result]
             assert "authorization" in fields
 
+    def test_cached_values_respect_settings(self, compiled, config):
+        """Repeated header values are cached per pattern set and min_numeric."""
+        headers = [{"name": "X-User", "value": "500"}]
+        args = (compiled["patterns"], compiled["exclude_union"])
+        ignore = config.get_all_ignore_headers()
+        first = _collect_ids_from_headers(headers, *args, 100, ignore)
+        assert first == _collect_ids_from_headers(headers, *args, 100, ignore)
+        assert _collect_ids_from_headers(headers, *args, 1000, ignore) == []
+        assert _collect_ids_from_headers(
+            headers, {}, compiled["exclude_union"], 100, ignore
+        ) == []
+        assert [r["value"] for r in first] == ["500"]
+
 
 class TestExtractIdsFromJson:
     """Tests for JSON ID extraction including nested structures."""
@@ -212,7 +258,7 @@ class TestExtractIdsFromJson:
             ]
         }
         result = _extract_ids_from_json(
-            data, compiled["patterns"], compiled["exclude_patterns"], compiled["min_numeric"]
+            data, compiled["patterns"], compiled["exclude_union"], compiled["min_numeric"]
         )
         values = [v for v, t, f in result]
         assert "12345" in values
@@ -229,12 +275,87 @@ class TestExtractIdsFromJson:
             [{"value": 22222}],
         ]
         result = _extract_ids_from_json(
-            data, compiled["patterns"], compiled["exclude_patterns"], compiled["min_numeric"]
+            data, compiled["patterns"], compiled["exclude_union"], compiled["min_numeric"]
         )
         values = [v for v, t, f in result]
         assert "11111" in values
         assert "22222" in values
 
+    def test_document_order(self, compiled):
+        """Nested results stay in document order."""
+        data = {"a": 11111, "b": {"c": 22222, "d": [{"e": 33333}]}, "f": 44444}
+        result = _extract_ids_from_json(
+            data, compiled["patterns"], compiled["exclude_union"], compiled["min_numeric"]
+        )
+        numeric = [(v, f) for v, t, f in result if t == "numeric"]
+        assert numeric == [
+            ("11111", "a"), ("22222", "b.c"), ("33333", "b.d[0].e"), ("44444", "f"),
+        ]
+
+    def test_very_deep_nesting(self, compiled):
+        """Nesting deeper than the recursion limit is handled."""
+        data: dict = {"id": 12345}
+        for _ in range(5000):
+            data = {"n": data}
+        result = _extract_ids_from_json(
+            data, compiled["patterns"], compiled["exclude_union"], compiled["min_numeric"]
+        )
+        assert ("12345", "numeric") in [(v, t) for v, t, f in result]
+
+
+def _events(data, prefix=""):
+    """Yield ijson.parse-style (prefix, event, value) tuples for data."""
+    if isinstance(data, dict):
+        yield prefix, "start_map", None
+        for key, value in data.items():
+            yield prefix, "map_key", key
+            yield from _events(value, f"{prefix}.{key}" if prefix else key)
+        yield prefix, "end_map", None
+    elif isinstance(data, list):
+        yield prefix, "start_array", None
+        for item in data:
+            yield from _events(item, f"{prefix}.item" if prefix else "item")
+        yield prefix, "end_array", None
+    elif data is None:
+        yield prefix, "null", None
+    elif isinstance(data, bool):
+        yield prefix, "boolean", data
+    elif isinstance(data, (int, float)):
+        yield prefix, "number", data
+    else:
+        yield prefix, "string", data
+
+
+_JSON_DOCS = [
+    {"id": 12345, "name": "test"},
+    {"users": [{"id": 11111}, {"id": 22222, "tags": ["33333", {"x": "44444"}]}]},
+    [[{"value": 55555}], 66666, {"n": 12.5, "z": None, "ok": True}],
+    {"": {"a": 77777}, "b": [], "c": {}},
+    "12345",
+]
+
+
+class TestExtractIdsFromJsonEvents:
+    """Tests for event-based JSON body extraction."""
+
+    @pytest.mark.parametrize("doc", _JSON_DOCS)
+    def test_matches_tree_walk(self, compiled, doc):
+        """Event extraction gives the same results as the tree walk."""
+        args = (compiled["patterns"], compiled["exclude_union"], compiled["min_numeric"])
+        assert _extract_ids_from_json_events(_events(doc), *args) == (
+            _extract_ids_from_json(doc, *args)
+        )
+
+    @pytest.mark.parametrize("doc", _JSON_DOCS)
+    def test_body_matches_tree_walk(self, compiled, doc, monkeypatch):
+        """Real ijson events give the same results as json.loads."""
+        pytest.importorskip("ijson")
+        args = (compiled["patterns"], compiled["exclude_union"], compiled["min_numeric"])
+        body = json.dumps(doc)
+        streamed = _extract_ids_from_json_body(body, *args)
+        monkeypatch.setattr(import_har_module, "_HAS_IJSON", False)
+        assert streamed == _extract_ids_from_json_body(body, *args)
+
 
 class TestCollectIdsFromBody:
     """Tests for body ID collection."""
@@ -244,7 +365,7 @@ class TestCollectIdsFromBody:
         body = "User ID: 12345678, Token: abc"
         result = _collect_ids_from_body(
             body, "text/plain",
-            compiled["patterns"], compiled["exclude_patterns"], compiled["min_numeric"],
+            compiled["patterns"], compiled["exclude_union"], compiled["min_numeric"],
         )
         values = [r["value"] for r in result]
         assert "12345678" in values
@@ -254,7 +375,7 @@ class TestCollectIdsFromBody:
         body = '{"user_id": 98765432, "name": "test"}'
         result = _collect_ids_from_body(
             body, "application/json",
-            compiled["patterns"], compiled["exclude_patterns"], compiled["min_numeric"],
+            compiled["patterns"], compiled["exclude_union"], compiled["min_numeric"],
         )
         values = [r["value"] for r in result]
         assert "98765432" in values
@@ -267,7 +388,7 @@ class TestCollectIdsFromBody:
         body = '{"invalid json: 12345678'
         result = _collect_ids_from_body(
             body, "application/json",
-            compiled["patterns"], compiled["exclude_patterns"], compiled["min_numeric"],
+            compiled["patterns"], compiled["exclude_union"], compiled["min_numeric"],
         )
         values = [r["value"] for r in result]
         assert "12345678" in values
@@ -279,7 +400,7 @@ class TestCollectIdsFromBody:
         """Test empty body returns no IDs."""
         result = _collect_ids_from_body(
             "", "application/json",
-            compiled["patterns"], compiled["exclude_patterns"], compiled["min_numeric"],
+            compiled["patterns"], compiled["exclude_union"], compiled["min_numeric"],
         )
         assert result == []
 
@@ -488,6 +609,26 @@ class TestBuildPotentialIdor:
         idor = _build_potential_idor(tracked)
         assert len(idor) == 0
 
+    def test_candidates_match_full_scan(self):
+        """IDs collected while building tracked_ids give the same IDOR list."""
+        def flow(ts, request, response):
+            return {
+                "timestamp": ts, "url": "u", "method": "GET",
+                "request_ids": [{"value": v, "type": "numeric"} for v in request],
+                "response_ids": [{"value": v, "type": "numeric"} for v in response],
+            }
+        flows = [
+            flow("1", ["300", "100"], ["200"]),
+            flow("2", ["200", "400"], ["100"]),
+            flow("3", ["300", "500"], []),
+        ]
+        no_origin: dict = {}
+        tracked = _build_tracked_ids(flows, no_origin)
+        assert list(no_origin) == ["300", "400", "500"]
+        fused = _build_potential_idor(tracked, no_origin)
+        assert fused == _build_potential_idor(tracked)
+        assert [i["id_value"] for i in fused] == ["300", "400", "500"]
+
 
 class TestImportHarErrors:
     """Tests for import_har error handling."""
@@ -506,6 +647,100 @@ class TestImportHarErrors:
             import_har(har_file)
 
 
+class TestIterHarEntries:
+    """Tests for streaming vs. full-load HAR entry iteration."""
+
+    def test_fallback_without_ijson(self, sample_har_file, sample_har_data, monkeypatch):
+        """Entries are loaded with the stdlib parser when ijson is missing."""
+        monkeypatch.setattr(import_har_module, "_HAS_IJSON", False)
+        entries = list(_iter_har_entries(sample_har_file))
+        assert entries == sample_har_data["log"]["entries"]
+
+    def test_fallback_missing_log(self, tmp_path, monkeypatch):
+        """A HAR without log.entries yields nothing."""
+        monkeypatch.setattr(import_har_module, "_HAS_IJSON", False)
+        har_file = tmp_path / "empty.har"
+        har_file.write_text("{}")
+        assert list(_iter_har_entries(har_file)) == []
+
+    def test_streaming_matches_fallback(self, sample_har_file, monkeypatch):
+        """ijson streaming yields the same entries as the full load."""
+        pytest.importorskip("ijson")
+        streamed = list(_iter_har_entries(sample_har_file))
+        monkeypatch.setattr(import_har_module, "_HAS_IJSON", False)
+        assert streamed == list(_iter_har_entries(sample_har_file))
+
+
+class TestFlowIds:
+    """Tests for HAR flow IDs."""
+
+    def test_flow_ids_follow_entry_order(self, sample_har_file):
+        """Flow IDs are the entry index in hex."""
+        report = import_har(sample_har_file)
+        assert [f["flow_id"] for f in report["flows"]] == ["00000000", "00000001", "00000002"]
+
+
+class TestParallelImport:
+    """Tests for importing with a process pool."""
+
+    def test_workers_match_serial(self, sample_har_file, monkeypatch):
+        """Parallel import produces the same report as serial import."""
+        monkeypatch.setattr(import_har_module, "_CHUNK_SIZE", 1)
+        serial = import_har(sample_har_file)
+        parallel = import_har(sample_har_file, workers=2)
+        assert parallel == serial
+
+    def test_chunked(self):
+        """Chunks keep order and the last one may be short."""
+        assert list(import_har_module._chunked(range(5), 2)) == [[0, 1], [2, 3], [4]]
+        assert list(import_har_module._chunked([], 2)) == []
+
+    def test_map_bounded_does_not_drain_source(self):
+        """Only a window of items is pulled from the source ahead of results."""
+        pulled = []
+
+        def source():
+            for i in range(100):
+                pulled.append(i)
+                yield i
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = import_har_module._map_bounded(executor, lambda x: x * 2, source(), 4)
+            assert next(results) == 0
+            assert len(pulled) == 5
+            assert list(results) == [x * 2 for x in range(1, 100)]
+        assert len(pulled) == 100
+
+
+class TestContentTypeFiltering:
+    """Tests for trackable content type matching in HAR import."""
+
+    def test_untracked_content_type_skipped(self, sample_har_file):
+        """Bodies whose MIME type is not trackable are not scanned."""
+        config = IdotakuConfig()
+        config.trackable_content_types = ["text/xml"]
+        report = import_har(sample_har_file, config=config)
+        assert all(not f["response_ids"] for f in report["flows"])
+
+    def test_empty_content_types_match_nothing(self, sample_har_file):
+        """An empty trackable list disables body scanning."""
+        config = IdotakuConfig()
+        config.trackable_content_types = []
+        report = import_har(sample_har_file, config=config)
+        assert all(not f["response_ids"] for f in report["flows"])
+
+    def test_content_type_with_parameters(self, sample_har_file, sample_har_data):
+        """MIME types with parameters still match by substring."""
+        for entry in sample_har_data["log"]["entries"]:
+            content = entry["response"]["content"]
+            if content:
+                content["mimeType"] = "application/json; charset=utf-8"
+        with open(sample_har_file, "w", encoding="utf-8") as f:
+            json.dump(sample_har_data, f)
+        report = import_har(sample_har_file)
+        assert any(f["response_ids"] for f in report["flows"])
+
+
 class TestDomainFiltering:
     """Tests for domain filtering in HAR import."""
 
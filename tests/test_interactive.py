@@ -1,5 +1,6 @@
 """Tests for interactive CLI prompts."""
 
+import os
 from unittest.mock import MagicMock, patch
 
 
@@ -88,6 +89,42 @@ class TestPromptReportFile:
         mock_q.select.return_value = _prompt(None)
         assert prompt_report_file() is None
 
+    @patch("idotaku.interactive.questionary")
+    def test_choices_newest_first_with_sizes(self, mock_q, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        old = tmp_path / "old.json"
+        new = tmp_path / "new.json"
+        old.write_text("x" * 2048)
+        new.write_text("{}")
+        os.utime(old, (1000, 1000))
+        os.utime(new, (2000, 2000))
+        mock_q.select.return_value = _prompt(None)
+        prompt_report_file()
+        choices = mock_q.select.call_args.kwargs["choices"]
+        assert [c["name"] for c in choices] == [
+            "new.json (2B)",
+            "old.json (2.0KB)",
+            "Other (enter path)...",
+        ]
+
+    @patch("idotaku.interactive.questionary")
+    def test_lists_ten_newest_files_only(self, mock_q, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        for i in range(12):
+            f = tmp_path / f"r{i:02d}.json"
+            f.write_text("{}")
+            os.utime(f, (1000 + i, 1000 + i))
+        (tmp_path / "dir.json").mkdir()
+        (tmp_path / ".hidden.json").write_text("{}")
+        (tmp_path / "notes.txt").write_text("")
+        mock_q.select.return_value = _prompt(None)
+        prompt_report_file()
+        choices = mock_q.select.call_args.kwargs["choices"]
+        assert [c["name"].split()[0] for c in choices[:-1]] == [
+            f"r{i:02d}.json" for i in range(11, 1, -1)
+        ]
+        assert choices[0]["value"] == str(tmp_path / "r11.json")
+
 
 # ---------------------------------------------------------------------------
 # prompt_domains
@@ -133,6 +170,18 @@ class TestPromptDomains:
         flows = [{"url": ""}, {"no_url": "x"}]
         assert prompt_domains(flows) == []
 
+    @patch("idotaku.interactive.questionary")
+    def test_repeated_urls_counted_per_flow(self, mock_q):
+        flows = [{"url": "https://b.com/same"}] * 12
+        flows += [{"url": f"https://a.com/{i}"} for i in range(11)]
+        mock_q.checkbox.return_value = _prompt(None)
+        prompt_domains(flows)
+        choices = mock_q.checkbox.call_args.kwargs["choices"]
+        assert [c["name"] for c in choices] == [
+            "b.com (12 flows)",
+            "a.com (11 flows)",
+        ]
+
 
 # ---------------------------------------------------------------------------
 # prompt_html_output
@@ -410,24 +459,24 @@ class TestRunInteractiveMode:
             run_interactive_mode()
 
     @patch("idotaku.interactive.prompt_continue", return_value=False)
-    @patch("click.echo")
     @patch("click.testing.CliRunner")
+    @patch("idotaku.commands.run_report")
     @patch("idotaku.interactive.prompt_report_file", return_value="report.json")
     @patch("idotaku.interactive.prompt_command", return_value="report")
     @patch("idotaku.banner.print_banner")
     def test_analysis_report_success(self, mock_banner, mock_cmd, mock_file,
-                                     MockRunner, mock_echo, mock_continue):
+                                     mock_run, MockRunner, mock_continue):
         mock_data = MagicMock()
         mock_data.flows = [{"url": "https://a.com"}]
-        mock_result = MagicMock()
-        mock_result.output = "Report output"
-        MockRunner.return_value.invoke.return_value = mock_result
-        with patch("idotaku.report.load_report", return_value=mock_data):
+        with patch("idotaku.report.load_report", return_value=mock_data) as mock_load:
             run_interactive_mode()
+        # The loaded report is handed over directly, not re-read via the CLI
+        mock_run.assert_called_once_with(mock_data)
+        mock_load.assert_called_once()
+        MockRunner.assert_not_called()
 
     @patch("idotaku.interactive.prompt_continue", return_value=False)
-    @patch("click.echo")
-    @patch("click.testing.CliRunner")
+    @patch("idotaku.commands.run_chain")
     @patch("idotaku.interactive.prompt_html_output", return_value="chain.html")
     @patch("idotaku.interactive.prompt_domains", return_value=["a.com"])
     @patch("idotaku.interactive.prompt_report_file", return_value="report.json")
@@ -435,19 +484,47 @@ class TestRunInteractiveMode:
     @patch("idotaku.banner.print_banner")
     def test_chain_with_domains_and_html(self, mock_banner, mock_cmd, mock_file,
                                          mock_domains, mock_html,
-                                         MockRunner, mock_echo, mock_continue):
+                                         mock_run, mock_continue):
+        mock_data = MagicMock()
+        mock_data.flows = [{"url": "https://a.com/1"}]
+        with patch("idotaku.report.load_report", return_value=mock_data):
+            run_interactive_mode()
+        mock_run.assert_called_once_with(
+            mock_data, domains="a.com", html_output="chain.html",
+        )
+
+    @patch("idotaku.interactive.prompt_command")
+    @patch("idotaku.commands.run_csv_export", side_effect=SystemExit(1))
+    @patch("idotaku.interactive.prompt_continue", return_value=True)
+    @patch("idotaku.interactive.prompt_report_file", return_value="report.json")
+    @patch("idotaku.banner.print_banner")
+    def test_direct_command_exit_keeps_session(self, mock_banner, mock_file,
+                                               mock_continue, mock_run, mock_cmd):
+        mock_cmd.side_effect = ["csv", None]
         mock_data = MagicMock()
         mock_data.flows = [{"url": "https://a.com/1"}]
+        with patch("idotaku.report.load_report", return_value=mock_data):
+            run_interactive_mode()
+        mock_run.assert_called_once_with(mock_data)
+        assert mock_cmd.call_count == 2
+
+    @patch("idotaku.interactive.prompt_continue", return_value=False)
+    @patch("click.echo")
+    @patch("click.testing.CliRunner")
+    @patch("idotaku.interactive.prompt_report_file", return_value="report.json")
+    @patch("idotaku.interactive.prompt_command", return_value="verify")
+    @patch("idotaku.banner.print_banner")
+    def test_verify_runs_through_cli(self, mock_banner, mock_cmd, mock_file,
+                                     MockRunner, mock_echo, mock_continue):
+        mock_data = MagicMock()
+        mock_data.flows = [{"url": "https://a.com"}]
         mock_result = MagicMock()
-        mock_result.output = "Chain output"
+        mock_result.output = "Verify output"
         MockRunner.return_value.invoke.return_value = mock_result
         with patch("idotaku.report.load_report", return_value=mock_data):
             run_interactive_mode()
-        # Verify CliRunner was called with domain and html args
-        call_args = MockRunner.return_value.invoke.call_args
-        args = call_args[0][1]  # positional args[1] is the command list
-        assert "--domains" in args
-        assert "--html" in args
+        args = MockRunner.return_value.invoke.call_args[0][1]
+        assert args == ["verify", "report.json"]
 
     @patch("idotaku.interactive.prompt_command", return_value="chain")
     @patch("idotaku.interactive.prompt_report_file", return_value="report.json")
@@ -55,6 +55,29 @@ class TestLoadReport:
         assert data.flows == []  # default
         assert data.tracked_ids == {}  # default
 
+    def test_load_non_ascii_report(self, tmp_path):
+        """Test that UTF-8 report content is decoded intact."""
+        report = tmp_path / "utf8.json"
+        report.write_text(
+            '{"tracked_ids": {"ユーザー_1": {"type": "string"}}}', encoding="utf-8"
+        )
+        data = load_report(report)
+        assert "ユーザー_1" in data.tracked_ids
+
+    def test_load_wide_int_ids_exact(self, tmp_path):
+        """Test that integers wider than 64 bits are not rounded to floats."""
+        report = tmp_path / "wide.json"
+        report.write_text('{"flows": [{"id": 123456789012345678901234}]}')
+        data = load_report(report)
+        assert data.flows[0]["id"] == 123456789012345678901234
+
+    def test_invalid_json_raises_when_not_exiting(self, tmp_path):
+        """Test that invalid JSON raises ReportLoadError with exit_on_error=False."""
+        bad_file = tmp_path / "bad.json"
+        bad_file.write_text("not valid json{{{")
+        with pytest.raises(ReportLoadError, match="Invalid JSON"):
+            load_report(bad_file, exit_on_error=False)
+
     def test_sorted_flows(self, sample_report_file):
         """Test that sorted_flows returns flows in timestamp order."""
         data = load_report(sample_report_file)
@@ -77,6 +100,18 @@ class TestLoadReport:
         assert data.is_idor("external_999") is True
         assert data.is_idor("12345") is False
 
+    def test_derived_data_built_on_first_access(self, sample_report_file):
+        """Test that sorted flows and IDOR values are computed lazily and cached."""
+        data = load_report(sample_report_file)
+        other = load_report(sample_report_file)
+        assert data._sorted_flows is None
+        assert data._idor_values is None
+
+        assert data.sorted_flows is data.sorted_flows
+        assert data.idor_values is data.idor_values
+        # Cache state does not affect equality
+        assert data == other
+
 
 class TestBuildParamProducerConsumer:
     """Tests for build_param_producer_consumer function."""
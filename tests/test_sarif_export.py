@@ -1,5 +1,6 @@
 """Tests for SARIF export."""
 
+import gzip
 import json
 
 from idotaku.export.sarif_exporter import export_sarif, _build_sarif_result
@@ -31,6 +32,12 @@ class TestBuildSarifResult:
         assert "abc-123" in result["message"]["text"]
         assert "uuid" in result["message"]["text"]
 
+    def test_message_placeholders_only_for_missing_keys(self):
+        result = _build_sarif_result({"reason": "r", "usages": []})
+        assert result["message"]["text"] == "Potential IDOR: unknown ID '?' - r"
+        result = _build_sarif_result({"id_value": "", "id_type": None, "reason": "r", "usages": []})
+        assert result["message"]["text"] == "Potential IDOR: None ID '' - r"
+
     def test_result_has_locations(self):
         finding = {
             "id_value": "999",
@@ -106,3 +113,29 @@ class TestExportSarif:
         tool = sarif["runs"][0]["tool"]["driver"]
         assert tool["name"] == "idotaku"
         assert "rules" in tool
+
+    def test_compact_by_default(self, sample_report_file, tmp_path):
+        output = tmp_path / "out.sarif.json"
+        data = load_report(sample_report_file)
+        export_sarif(output, data)
+
+        content = output.read_text(encoding="utf-8")
+        assert "\n" not in content
+        assert json.loads(content)["version"] == "2.1.0"
+
+    def test_pretty_indents(self, sample_report_file, tmp_path):
+        output = tmp_path / "out.sarif.json"
+        data = load_report(sample_report_file)
+        export_sarif(output, data, pretty=True)
+
+        content = output.read_text(encoding="utf-8")
+        assert '\n  "version": "2.1.0"' in content
+
+    def test_gz_path_compressed(self, sample_report_file, tmp_path):
+        output = tmp_path / "out.sarif.json.gz"
+        data = load_report(sample_report_file)
+        export_sarif(output, data)
+
+        with gzip.open(output, "rt", encoding="utf-8") as f:
+            sarif = json.load(f)
+        assert sarif["version"] == "2.1.0"
@@ -1,10 +1,15 @@
 """Tests for sequence diagram export module."""
 
+import gzip
+
 import pytest
 
 from idotaku.export.sequence_exporter import (
     _build_lifeline_key,
+    _build_page_data,
     _build_sequence_data,
+    _iter_rows_html,
+    _render_chips_html,
     export_sequence_html,
 )
 
@@ -99,6 +104,30 @@ class TestBuildSequenceData:
         assert data["flows"][0]["method"] == "POST"
         assert data["flows"][1]["method"] == "GET"
 
+    def test_flow_display_fields_prebuilt(self, sample_flows, sample_tracked_ids, sample_idor):
+        """Test that arrow label and time are precomputed per flow."""
+        data = _build_sequence_data(sample_flows, sample_tracked_ids, sample_idor)
+        flow = data["flows"][1]
+        assert flow["time"] == "10:01:00"
+        assert '<span class="method GET">GET</span>' in flow["label_html"]
+        assert 'title="https://api.example.com/users/12345"' in flow["label_html"]
+        assert ">/users/12345</span>" in flow["label_html"]
+
+    def test_flow_display_fields_escaped(self):
+        """Test that precomputed label/time HTML is escaped and truncated."""
+        flows = [{
+            "method": "GET",
+            "url": "https://api.example.com/a<b>/" + "x" * 40 + "?q='\"",
+            "timestamp": "<script>",
+        }]
+        data = _build_sequence_data(flows, {}, [])
+        flow = data["flows"][0]
+        assert flow["time"] == ""
+        assert "<b>" not in flow["label_html"]
+        assert "&lt;b&gt;" in flow["label_html"]
+        assert "&#x27;&quot;" in flow["label_html"]
+        assert "..</span>" in flow["label_html"]
+
     def test_idor_values_included(self, sample_flows, sample_tracked_ids, sample_idor):
         """Test that IDOR values are included."""
         data = _build_sequence_data(sample_flows, sample_tracked_ids, sample_idor)
@@ -194,7 +223,30 @@ class TestExportSequenceHtml:
         export_sequence_html(output, [], {}, [])
         assert output.exists()
         content = output.read_text(encoding="utf-8")
-        assert '"flows": []' in content or '"flows":[]' in content
+        assert "No API flows" in content
+        assert 'class="seq-row"' not in content
+
+    def test_rows_rendered_in_html(self, tmp_path, sample_flows):
+        """Test that rows and headers are rendered at export time."""
+        output = tmp_path / "sequence.html"
+        export_sequence_html(output, sample_flows, {}, [])
+        content = output.read_text(encoding="utf-8")
+
+        assert content.count('<div class="seq-row">') == len(sample_flows)
+        assert 'class="seq-header-cell client"' in content
+        assert "min-width:" in content
+        assert '"flows"' not in content
+
+    def test_null_or_missing_method(self, tmp_path, sample_flows):
+        """Test that flows with a null or missing method export as '?'."""
+        sample_flows[0]["method"] = None
+        del sample_flows[1]["method"]
+        output = tmp_path / "sequence.html"
+        export_sequence_html(output, sample_flows, {}, [])
+        content = output.read_text(encoding="utf-8")
+
+        assert content.count('<span class="method ?">?</span>') == 2
+        assert "None" not in content
 
     def test_idor_values_in_html(self, tmp_path, sample_flows):
         """Test that IDOR values appear in HTML data."""
@@ -203,3 +255,79 @@ class TestExportSequenceHtml:
         export_sequence_html(output, sample_flows, {}, idor)
         content = output.read_text(encoding="utf-8")
         assert "12345" in content
+
+    def test_layout_styles_in_head(self, tmp_path, sample_flows):
+        """Test that all sequence styles are inlined in <head>."""
+        output = tmp_path / "sequence.html"
+        export_sequence_html(output, sample_flows, {}, [])
+        content = output.read_text(encoding="utf-8")
+
+        head, body = content.split("</head>", 1)
+        for rule in (".security-warning", ".seq-header {", ".seq-row {",
+                     ".seq-cell {", ".seq-arrow {", ".id-chip {"):
+            assert rule in head
+        assert "<style" not in body
+
+    def test_gz_path_compressed(self, tmp_path, sample_flows):
+        """Test that a .gz output path is written gzip-compressed."""
+        output = tmp_path / "sequence.html.gz"
+        export_sequence_html(output, sample_flows, {}, [])
+
+        with gzip.open(output, "rt", encoding="utf-8") as f:
+            content = f.read()
+        assert content.startswith("<!DOCTYPE html>")
+        assert "seqData" in content
+
+
+class TestRenderRowsHtml:
+    """Tests for export-time row rendering helpers."""
+
+    @pytest.fixture
+    def seq_data(self):
+        flows = [
+            {
+                "method": "GET",
+                "url": "https://api.example.com/users/1",
+                "timestamp": "2024-01-01T10:00:00Z",
+                "request_ids": [{"value": "1", "type": "numeric", "location": "path"}],
+                "response_ids": [{"value": "abc", "type": "token", "location": "body", "field": "token"}],
+            },
+        ]
+        return _build_sequence_data(flows, {}, [{"id_value": "1"}])
+
+    def test_row_markup(self, seq_data):
+        """Test row markup: index, time, arrow geometry and chips."""
+        value_index = {}
+        rows = list(_iter_rows_html(seq_data, value_index))
+        assert len(rows) == 1
+        row = rows[0]
+        assert row.startswith('<div class="seq-row">')
+        assert '<span class="seq-row-index">#1</span>' in row
+        assert '<span class="seq-row-time">10:00:00</span>' in row
+        assert row.count('<div class="seq-cell"></div>') == len(seq_data["lifelines"])
+        assert 'style="left:80px;width:160px;"' in row
+        assert 'class="id-chip consumes idor" data-vi="0" title="1 (path)"' in row
+        assert 'class="id-chip produces" data-vi="1"' in row
+        assert value_index == {"1": 0, "abc": 1}
+
+    def test_chips_collapsed_and_escaped(self):
+        """Test chip overflow, label truncation and escaping."""
+        ids = [{"value": f"<v{i}>"} for i in range(6)]
+        ids[0] = {"value": "a" * 20}
+        value_index = {"<v2>": 0}
+        html = _render_chips_html(ids, "consumes", set(), value_index)
+        assert html.count('class="id-chip') == 4
+        assert '<span class="chips-more">+2</span>' in html
+        assert "aaaaaaaaaa..<" in html
+        assert 'data-vi="2" title="&lt;v1&gt;"' in html
+        assert 'data-vi="0" title="&lt;v2&gt;"' in html
+        assert list(value_index) == ["<v2>", "a" * 20, "<v1>", "<v3>"]
+
+    def test_page_data_origin_formatted(self, seq_data):
+        """Test page data keeps only ID info with a formatted origin."""
+        data = _build_page_data(seq_data, {"abc": 0})
+        assert set(data) == {"values", "id_info", "idor_values"}
+        assert data["values"] == ["abc"]
+        assert data["id_info"]["abc"] == ["token", "GET /users/1", 0]
+        assert data["id_info"]["1"] == ["numeric", "No origin found", 1]
+        assert data["idor_values"] == {"1": 1}
@@ -1,13 +1,20 @@
 """Tests for utility functions."""
 
+import json
+from types import MappingProxyType
+
+import pytest
 
 from idotaku.utils import (
     normalize_api_path,
+    normalize_path,
     extract_domain,
     get_base_domain,
     truncate_text,
     truncate_id,
 )
+from idotaku.utils import jsonio
+from idotaku.utils.jsonio import dumps, loads
 
 
 class TestNormalizeApiPath:
@@ -39,6 +46,21 @@ class TestNormalizeApiPath:
         assert normalize_api_path("https://api.example.com/") == "/"
 
 
+class TestNormalizePath:
+    """Tests for normalize_path function."""
+
+    def test_matches_normalize_api_path(self):
+        """Test that a parsed path normalizes like the full URL."""
+        assert normalize_path("/users/1/orders/2") == "/users/{id}/orders/{id}"
+        assert normalize_path("/users/1/orders/2") == normalize_api_path(
+            "https://api.example.com/users/1/orders/2"
+        )
+
+    def test_empty_path(self):
+        """Test that an empty path normalizes to root."""
+        assert normalize_path("") == "/"
+
+
 class TestExtractDomain:
     """Tests for extract_domain function."""
 
@@ -52,6 +74,10 @@ class TestExtractDomain:
         assert extract_domain("not-a-url") == ""
         assert extract_domain("") == ""
 
+    def test_unhashable_input(self):
+        """Test that non-string input is rejected before the cache lookup."""
+        assert extract_domain(["https://api.example.com"]) == ""
+
 
 class TestGetBaseDomain:
     """Tests for get_base_domain function."""
@@ -106,3 +132,74 @@ class TestTruncateId:
         uuid = "550e8400-e29b-41d4-a716-446655440000"
         result = truncate_id(uuid)
         assert result.endswith("...")
+
+
+class TestJsonDumps:
+    """Tests for jsonio.dumps function."""
+
+    def test_compact_and_unicode(self):
+        """Test compact output that keeps non-ASCII characters."""
+        assert dumps({"a": [1, "é"]}) == '{"a":[1,"é"]}'
+
+    def test_pretty(self):
+        """Test indented output."""
+        assert dumps({"a": 1}, pretty=True) == '{\n  "a": 1\n}'
+
+    def test_stdlib_fallback(self, monkeypatch):
+        """Test output without orjson matches the fast path."""
+        monkeypatch.setattr(jsonio, "_HAS_ORJSON", False)
+        assert dumps({"a": [1, "é"]}) == '{"a":[1,"é"]}'
+        assert dumps({"a": 1}, pretty=True) == '{\n  "a": 1\n}'
+
+    def test_wide_int_falls_back(self):
+        """Test data orjson rejects is still serialized."""
+        assert dumps([2**70]) == f"[{2**70}]"
+
+    def test_read_only_mapping(self, monkeypatch):
+        """Test MappingProxyType values serialize as objects on both paths."""
+        data = {"rules": (MappingProxyType({"id": "R1"}),)}
+        assert dumps(data) == '{"rules":[{"id":"R1"}]}'
+        monkeypatch.setattr(jsonio, "_HAS_ORJSON", False)
+        assert dumps(data) == '{"rules":[{"id":"R1"}]}'
+
+
+class TestJsonLoads:
+    """Tests for jsonio.loads function."""
+
+    def test_bytes_and_str(self):
+        """Test parsing both UTF-8 bytes and text."""
+        assert loads('{"a": [1, "é"]}'.encode()) == {"a": [1, "é"]}
+        assert loads('{"a": 1}') == {"a": 1}
+
+    def test_without_orjson(self, monkeypatch):
+        """Test parsing does not depend on orjson being installed."""
+        monkeypatch.setattr(jsonio, "_HAS_ORJSON", False)
+        assert loads(b'{"a": 1}') == {"a": 1}
+
+    def test_nan_literal(self):
+        """Test NaN literals are accepted."""
+        result = loads("[NaN]")
+        assert result[0] != result[0]
+
+    def test_invalid_json_raises(self):
+        """Test invalid input raises json.JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            loads("not json")
+
+    def test_wide_ints_stay_exact(self):
+        """Test integers wider than 64 bits round-trip without becoming floats."""
+        data = {"id": 123456789012345678901234, "neg": -9999999999999999999, "max": 2**64 - 1}
+        assert loads(dumps(data)) == data
+        assert loads(dumps(data).encode()) == data
+        assert isinstance(loads(dumps(data))["id"], int)
+
+    def test_long_digit_string_single_pass(self, monkeypatch):
+        """Test a 19-digit string is decoded in one pass, with no pre-scan or retry."""
+        calls = []
+        real_loads = json.loads
+        monkeypatch.setattr(
+            jsonio.json, "loads", lambda data: calls.append(data) or real_loads(data)
+        )
+        doc = b'{"snowflake": "1234567890123456789012"}'
+        assert loads(doc) == {"snowflake": "1234567890123456789012"}
+        assert calls == [doc]